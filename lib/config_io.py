@@ -0,0 +1,89 @@
+"""Shared JSON persistence helpers for the on-disk config stores."""
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+
+try:
+    # Optional accelerator: orjson serializes/parses several times faster
+    # than stdlib json. Everything falls back to stdlib when it is absent.
+    import orjson
+except ImportError:  # pragma: no cover - depends on environment
+    orjson = None
+
+
+def load_json(path: Path) -> Any:
+    """Load a JSON document from disk."""
+    if orjson is not None:
+        with open(path, "rb") as f:
+            return orjson.loads(f.read())
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+@lru_cache(maxsize=8)
+def _load_json_cached(path_str: str, mtime_ns: int) -> Any:
+    return load_json(Path(path_str))
+
+
+def load_json_cached(path: Path) -> Any:
+    """Load a JSON document, memoized on (path, mtime).
+
+    Repeated reads of an unchanged file skip the disk IO and the parse;
+    keying on st_mtime_ns invalidates the cache automatically when the
+    file is rewritten. Callers must treat the result as read-only since
+    the parsed object is shared between calls.
+    """
+    path = Path(path)
+    return _load_json_cached(str(path), path.stat().st_mtime_ns)
+
+
+def dumps_json(data: Any) -> str:
+    """Serialize to an indented JSON string, via orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode("utf-8")
+    return json.dumps(data, indent=2, ensure_ascii=False)
+
+
+def serialize_json(data: Any) -> bytes:
+    """Serialize to indented UTF-8 JSON bytes, via orjson when available.
+
+    Split out from dump_json_atomic so callers can take a snapshot of a
+    mutable structure on one thread and hand only the immutable bytes to
+    another for the disk write.
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def write_bytes_atomic(path: Path, payload: bytes) -> None:
+    """Write payload to path via a sibling temp file and os.replace.
+
+    Readers never observe a truncated file even if the process dies
+    mid-write.
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(
+        dir=path.parent, prefix=f".{path.name}.", suffix=".tmp"
+    )
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(payload)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def dump_json_atomic(path: Path, data: Any) -> None:
+    """Serialize a JSON document and write it atomically."""
+    write_bytes_atomic(path, serialize_json(data))
@@ -1,269 +1,367 @@
 """Dashboard Widget for Domain Group Management"""
-import json
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, Dict, List, Any, Callable
+from typing import Optional, Dict, List, Any, Tuple
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
-    QListWidget, QListWidgetItem, QMenu, QMessageBox,
+    QListView, QStyledItemDelegate, QStyle, QMenu, QMessageBox,
     QInputDialog, QColorDialog, QSplitter, QFrame,
-    QScrollArea, QGridLayout, QToolButton, QApplication, QToolTip
+    QScrollArea, QAbstractItemView, QToolButton, QApplication, QToolTip
 )
-from PyQt6.QtCore import Qt, pyqtSignal, QMimeData, QPoint, QTimer, QRect
-from PyQt6.QtGui import QDragEnterEvent, QDropEvent, QDrag, QColor, QFont
-
-
-class DomainItem(QWidget):
-    """Custom widget for domain display in groups"""
-    clicked = pyqtSignal(str)
-    remove_clicked = pyqtSignal(str)  # Signal for remove button
-    selection_requested = pyqtSignal(object, object)
-
-    def __init__(
-        self,
-        domain: str,
-        show_remove: bool = False,
-        is_porkbun_ns: bool = True,
-        selection_enabled: bool = False,
-        selection_provider: Optional[Callable[[], List[str]]] = None,
-        parent=None,
-    ):
+from PyQt6.QtCore import (
+    Qt, pyqtSignal, QMimeData, QPoint, QTimer, QRect, QSize, QEvent,
+    QAbstractListModel, QModelIndex, QObject, QRunnable, QThreadPool
+)
+from PyQt6.QtGui import QDragEnterEvent, QDropEvent, QColor, QFont, QPen
+
+from lib.config_io import load_json, serialize_json, write_bytes_atomic
+
+
+# Store locations, resolved once at import
+DASHBOARD_STORE_FILE = Path.home() / ".porkbun_dns" / "dashboard_profiles.json"
+LEGACY_DASHBOARD_FILE = Path.home() / ".porkbun_dashboard.json"
+
+
+# Custom roles for DomainListModel
+DOMAIN_ROLE = Qt.ItemDataRole.UserRole
+IS_PORKBUN_ROLE = Qt.ItemDataRole.UserRole + 1
+
+
+@lru_cache(maxsize=64)
+def _group_style(color: str) -> str:
+    """Formatted DomainGroup stylesheet, cached per color."""
+    return f"""
+        DomainGroup {{
+            background: {color};
+            border: 1px solid #dee2e6;
+            border-radius: 6px;
+            margin: 2px;
+        }}
+        DomainGroup:hover {{
+            border: 1px solid #adb5bd;
+        }}
+    """
+
+
+# Shared QColor/QPen singletons for the delegate's hot paint path; both
+# panel delegates reuse these instead of constructing colors per paint call
+ROW_COLORS = {
+    "bg": QColor("#ffffff"),
+    "bg_hover": QColor("#f0f8ff"),
+    "bg_selected": QColor("#e7f1ff"),
+    "bg_selected_hover": QColor("#d7e9ff"),
+    "text": QColor("#2c3e50"),
+    "text_warning": QColor("#e74c3c"),
+    "button_text": QColor("white"),
+    "dns": QColor("#007bff"),
+    "copy": QColor("#17a2b8"),
+    "remove": QColor("#dc3545"),
+}
+
+ROW_BORDER_PENS = {
+    "normal": QPen(QColor("#e1e5e9"), 1),
+    "hover": QPen(QColor("#007bff"), 1),
+    "selected": QPen(QColor("#5b9bff"), 2),
+    "selected_hover": QPen(QColor("#1c7cd6"), 2),
+}
+
+
+@lru_cache(maxsize=64)
+def _group_drag_style(color: str) -> str:
+    """Drag-highlight variant of the DomainGroup stylesheet."""
+    return f"""
+        DomainGroup {{
+            background: {color};
+            border: 2px solid #007bff;
+            border-radius: 6px;
+            margin: 2px;
+        }}
+    """
+
+
+class DomainListModel(QAbstractListModel):
+    """List model holding (domain, is_porkbun) rows for a domain panel.
+
+    하나의 모델이 미분류 패널 또는 그룹 하나의 도메인 목록을 담당한다.
+    위젯을 도메인마다 만들지 않으므로 수백 개 도메인도 O(1) 수준으로
+    표시할 수 있다.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows: List[Tuple[str, bool]] = []  # (domain, is_porkbun)
+        self._index: Dict[str, int] = {}  # 도메인 → 행 번호 (O(1) 조회용)
+
+    # --- Qt model interface -------------------------------------------
+    def rowCount(self, parent=QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+        return len(self._rows)
+
+    def data(self, index: QModelIndex, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or not (0 <= index.row() < len(self._rows)):
+            return None
+        domain, is_porkbun = self._rows[index.row()]
+        if role in (Qt.ItemDataRole.DisplayRole, DOMAIN_ROLE):
+            return domain
+        if role == IS_PORKBUN_ROLE:
+            return is_porkbun
+        if role == Qt.ItemDataRole.ToolTipRole and not is_porkbun:
+            return "외부 네임서버 사용 중"
+        return None
+
+    def flags(self, index: QModelIndex):
+        if not index.isValid():
+            return Qt.ItemFlag.NoItemFlags
+        return (
+            Qt.ItemFlag.ItemIsEnabled
+            | Qt.ItemFlag.ItemIsSelectable
+            | Qt.ItemFlag.ItemIsDragEnabled
+        )
+
+    def mimeTypes(self) -> List[str]:
+        return ["text/plain"]
+
+    def mimeData(self, indexes) -> QMimeData:
+        domains = [index.data(DOMAIN_ROLE) for index in indexes if index.isValid()]
+        mime_data = QMimeData()
+        mime_data.setText("\n".join(domains))
+        return mime_data
+
+    def supportedDragActions(self):
+        return Qt.DropAction.MoveAction
+
+    # --- Convenience helpers ------------------------------------------
+    def domains(self) -> List[str]:
+        return [domain for domain, _ in self._rows]
+
+    def contains(self, domain: str) -> bool:
+        return domain in self._index
+
+    def _reindex_from(self, start: int):
+        """Refresh the domain→row map for rows at or after start."""
+        for row in range(start, len(self._rows)):
+            self._index[self._rows[row][0]] = row
+
+    def set_rows(self, rows: List[Tuple[str, bool]]):
+        """Replace all rows in a single model reset."""
+        self.beginResetModel()
+        self._rows = list(rows)
+        self._index = {domain: row for row, (domain, _) in enumerate(self._rows)}
+        self.endResetModel()
+
+    def add_row(self, domain: str, is_porkbun: bool = True):
+        position = len(self._rows)
+        self.beginInsertRows(QModelIndex(), position, position)
+        self._rows.append((domain, is_porkbun))
+        self._index[domain] = position
+        self.endInsertRows()
+
+    def remove_domain(self, domain: str) -> bool:
+        row = self._index.pop(domain, None)
+        if row is None:
+            return False
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self._rows[row]
+        self.endRemoveRows()
+        self._reindex_from(row)  # 뒤따르는 행들의 번호가 하나씩 당겨짐
+        return True
+
+    def set_domain_status(self, domain: str, is_porkbun: bool):
+        row = self._index.get(domain)
+        if row is None:
+            return
+        existing, current = self._rows[row]
+        if current != is_porkbun:
+            self._rows[row] = (existing, is_porkbun)
+            index = self.index(row)
+            self.dataChanged.emit(index, index)
+
+
+class DomainItemDelegate(QStyledItemDelegate):
+    """Owner-drawn delegate that paints a full domain row with QPainter.
+
+    기존 DomainItem(QFrame + QLabel + QToolButton)이 도메인마다 위젯을
+    생성하던 것을 대체한다. 버튼은 editorEvent에서 히트 테스트로 처리한다.
+    """
+
+    dns_clicked = pyqtSignal(str)
+    remove_clicked = pyqtSignal(str)
+
+    ROW_HEIGHT = 28
+    BUTTON_LABELS = {"dns": "DNS", "copy": "📋", "remove": "×"}
+    BUTTON_TOOLTIPS = {
+        "dns": "DNS 레코드 관리",
+        "copy": "도메인 복사",
+        "remove": "미분류로 이동",
+    }
+
+    def __init__(self, show_remove: bool = False, parent=None):
         super().__init__(parent)
-        self.domain = domain
         self.show_remove = show_remove
-        self.is_porkbun_ns = is_porkbun_ns
-        self.selection_enabled = selection_enabled
-        self.selection_provider = selection_provider
-        self._selected = False
-        self._base_style = ""
-        self._selected_style = ""
-        self._pending_single_select = False
-        self._drag_in_progress = False
-        self.setObjectName("domainItem")
-        self.setAttribute(Qt.WidgetAttribute.WA_StyledBackground, True)
-        self.setup_ui()
+        self._pressed_button = None
 
-    def setup_ui(self):
-        # 프레임 제거하고 단순한 배경색과 호버 효과만 적용
-        self._base_style = """
-            #domainItem {
-                background: #ffffff;
-                border: 1px solid #e1e5e9;
-                border-radius: 6px;
-                padding: 4px 8px;
-            }
-            #domainItem:hover {
-                background: #f0f8ff;
-                border: 1px solid #007bff;
-            }
-        """
-        self._selected_style = """
-            #domainItem {
-                background: #e7f1ff;
-                border: 2px solid #5b9bff;
-                border-radius: 6px;
-                padding: 3px 7px;
-            }
-            #domainItem:hover {
-                background: #d7e9ff;
-                border: 2px solid #1c7cd6;
-            }
-        """
-        self._apply_selection_style()
-        
-        layout = QHBoxLayout()
-        layout.setContentsMargins(6, 4, 6, 4)
-        layout.setSpacing(6)
-        
-        # Domain label with color based on nameserver status
-        display_text = self.domain
-        if not self.is_porkbun_ns:
-            display_text = f"⚠ {self.domain}"
-        
-        self.label = QLabel(display_text)
-        # 텍스트 표시 최적화 - 더 넉넉한 공간과 완전한 텍스트 표시
-        self.label.setMinimumWidth(120)
-        self.label.setMaximumWidth(200)
-        self.label.setWordWrap(False)
-        self.label.setTextFormat(Qt.TextFormat.PlainText)
-        
-        if self.is_porkbun_ns:
-            self.label.setStyleSheet("""
-                font-size: 12px; 
-                color: #2c3e50; 
-                font-weight: 500; 
-                font-family: 'Segoe UI', Arial, sans-serif;
-                background: transparent;
-                border: none;
-            """)
-        else:
-            self.label.setStyleSheet("""
-                font-size: 12px; 
-                color: #e74c3c; 
-                font-weight: 600; 
-                font-family: 'Segoe UI', Arial, sans-serif;
-                background: transparent;
-                border: none;
-            """)
-            self.label.setToolTip("외부 네임서버 사용 중")
-        layout.addWidget(self.label)
-        
-        layout.addStretch()
-        
+        self.domain_font = QFont("Segoe UI", 9)
+        self.domain_font_warning = QFont("Segoe UI", 9)
+        self.domain_font_warning.setBold(True)
+        self.button_font = QFont("Segoe UI", 7)
+
+    def sizeHint(self, option, index) -> QSize:
+        return QSize(200, self.ROW_HEIGHT)
+
+    def _button_rects(self, rect: QRect) -> Dict[str, QRect]:
+        """Compute button rectangles, right-aligned inside the row rect."""
+        rects: Dict[str, QRect] = {}
+        button_height = 16
+        y = rect.y() + (rect.height() - button_height) // 2
+        x = rect.right() - 6
+
+        # DNS control button (rightmost)
+        x -= 30
+        rects["dns"] = QRect(x, y, 30, button_height)
+        # Copy button
+        x -= 22 + 6
+        rects["copy"] = QRect(x, y, 22, button_height)
         # Remove button (only for grouped domains)
         if self.show_remove:
-            self.remove_btn = QToolButton()
-            self.remove_btn.setText("×")  # Cross mark
-            self.remove_btn.setStyleSheet("""
-                QToolButton {
-                    background: #dc3545;
-                    color: white;
-                    border: none;
-                    border-radius: 2px;
-                    padding: 1px 3px;
-                    font-size: 9px;
-                    font-weight: 500;
-                    font-family: 'Segoe UI', Arial, sans-serif;
-                }
-                QToolButton:hover {
-                    background: #c82333;
-                }
-            """)
-            self.remove_btn.setToolTip("미분류로 이동")
-            self.remove_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-            self.remove_btn.clicked.connect(lambda: self.remove_clicked.emit(self.domain))
-            layout.addWidget(self.remove_btn)
-        
-        # Copy button next to DNS controls
-        self.copy_btn = QToolButton()
-        self.copy_btn.setText("📋")
-        self.copy_btn.setStyleSheet("""
-            QToolButton {
-                background: #17a2b8;
-                color: white;
-                border: none;
-                border-radius: 2px;
-                padding: 1px 4px;
-                font-size: 9px;
-                font-weight: 500;
-                font-family: 'Segoe UI', Arial, sans-serif;
-            }
-            QToolButton:hover {
-                background: #117a8b;
-            }
-        """)
-        self.copy_btn.setToolTip("도메인 복사")
-        self.copy_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        self.copy_btn.clicked.connect(self.copy_domain)
-        layout.addWidget(self.copy_btn)
-
-        # DNS control button
-        self.dns_btn = QToolButton()
-        self.dns_btn.setText("DNS")
-        self.dns_btn.setStyleSheet("""
-            QToolButton {
-                background: #007bff;
-                color: white;
-                border: none;
-                border-radius: 2px;
-                padding: 1px 4px;
-                font-size: 9px;
-                font-weight: 500;
-                font-family: 'Segoe UI', Arial, sans-serif;
-            }
-            QToolButton:hover {
-                background: #0056b3;
-            }
-        """)
-        self.dns_btn.setToolTip("DNS 레코드 관리")
-        self.dns_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        self.dns_btn.clicked.connect(lambda: self.clicked.emit(self.domain))
-        layout.addWidget(self.dns_btn)
-        
-        self.setLayout(layout)
-        self.setMaximumHeight(28)
-        self.setMinimumHeight(28)
-        self.setMinimumWidth(200)
+            x -= 16 + 6
+            rects["remove"] = QRect(x, y, 16, button_height)
+        return rects
 
-    def _apply_selection_style(self):
-        if self._selected:
-            self.setStyleSheet(self._selected_style)
+    def paint(self, painter, option, index):
+        painter.save()
+        painter.setRenderHint(painter.RenderHint.Antialiasing, True)
+
+        rect = option.rect.adjusted(0, 1, -1, -1)
+        selected = bool(option.state & QStyle.StateFlag.State_Selected)
+        hovered = bool(option.state & QStyle.StateFlag.State_MouseOver)
+
+        # Row background (mirrors the old #domainItem stylesheet)
+        if selected:
+            background = ROW_COLORS["bg_selected_hover"] if hovered else ROW_COLORS["bg_selected"]
+            pen = ROW_BORDER_PENS["selected_hover"] if hovered else ROW_BORDER_PENS["selected"]
         else:
-            self.setStyleSheet(self._base_style)
+            background = ROW_COLORS["bg_hover"] if hovered else ROW_COLORS["bg"]
+            pen = ROW_BORDER_PENS["hover"] if hovered else ROW_BORDER_PENS["normal"]
+        painter.setBrush(background)
+        painter.setPen(pen)
+        painter.drawRoundedRect(rect, 6, 6)
 
-    def set_selected(self, selected: bool):
-        if not self.selection_enabled:
-            return
-        if self._selected != selected:
-            self._selected = selected
-            self._apply_selection_style()
+        is_porkbun = index.data(IS_PORKBUN_ROLE)
+        domain = index.data(DOMAIN_ROLE) or ""
 
-    def is_selected(self) -> bool:
-        return self._selected
+        button_rects = self._button_rects(rect)
+        buttons_left = min(r.left() for r in button_rects.values())
 
-    def copy_domain(self):
-        """Copy this domain name to clipboard"""
-        QApplication.clipboard().setText(self.domain)
-        QToolTip.showText(
-            self.copy_btn.mapToGlobal(QPoint(0, self.copy_btn.height())),
-            f"복사됨: {self.domain}",
-            self.copy_btn,
-            QRect(),
-            2000,
-        )
-        
-    def mousePressEvent(self, event):
-        if event.button() == Qt.MouseButton.LeftButton:
-            modifiers = event.modifiers()
-            if self.selection_enabled:
-                if (
-                    modifiers == Qt.KeyboardModifier.NoModifier
-                    and self._selected
-                    and self.selection_provider
-                ):
-                    selected_now = self.selection_provider() or []
-                    if len(selected_now) > 1:
-                        self._pending_single_select = True
-                    else:
-                        self.selection_requested.emit(self, modifiers)
-                        self._pending_single_select = False
-                else:
-                    self.selection_requested.emit(self, modifiers)
-                    self._pending_single_select = False
-            else:
-                self._pending_single_select = False
-            self.drag_start_position = event.pos()
-            self._drag_in_progress = False
-        super().mousePressEvent(event)
+        # Domain label with color based on nameserver status
+        if is_porkbun:
+            painter.setFont(self.domain_font)
+            painter.setPen(ROW_COLORS["text"])
+            display_text = domain
+        else:
+            painter.setFont(self.domain_font_warning)
+            painter.setPen(ROW_COLORS["text_warning"])
+            display_text = f"⚠ {domain}"
 
-    def mouseMoveEvent(self, event):
-        if not (event.buttons() & Qt.MouseButton.LeftButton):
-            return
-        if (event.pos() - self.drag_start_position).manhattanLength() < QApplication.startDragDistance():
-            return
-        self._drag_in_progress = True
-        self._pending_single_select = False
-        drag = QDrag(self)
-        mime_data = QMimeData()
-        domains_to_drag = [self.domain]
-        if self.selection_enabled and self.selection_provider:
-            selected_domains = self.selection_provider()
-            if selected_domains and self.domain in selected_domains:
-                domains_to_drag = selected_domains
-        mime_data.setText("\n".join(domains_to_drag))
-        drag.setMimeData(mime_data)
-        drag.exec(Qt.DropAction.MoveAction)
-
-    def mouseReleaseEvent(self, event):
-        if (
-            event.button() == Qt.MouseButton.LeftButton
-            and self.selection_enabled
-            and self._pending_single_select
-            and not self._drag_in_progress
-        ):
-            self.selection_requested.emit(self, Qt.KeyboardModifier.NoModifier)
-        self._pending_single_select = False
-        self._drag_in_progress = False
-        super().mouseReleaseEvent(event)
+        text_rect = QRect(rect.left() + 12, rect.top(),
+                          buttons_left - rect.left() - 18, rect.height())
+        metrics = painter.fontMetrics()
+        elided = metrics.elidedText(display_text, Qt.TextElideMode.ElideRight,
+                                    text_rect.width())
+        painter.drawText(text_rect, Qt.AlignmentFlag.AlignVCenter, elided)
+
+        # Buttons
+        painter.setFont(self.button_font)
+        for name, button_rect in button_rects.items():
+            painter.setBrush(ROW_COLORS[name])
+            painter.setPen(Qt.PenStyle.NoPen)
+            painter.drawRoundedRect(button_rect, 2, 2)
+            painter.setPen(ROW_COLORS["button_text"])
+            painter.drawText(button_rect, Qt.AlignmentFlag.AlignCenter,
+                             self.BUTTON_LABELS[name])
+
+        painter.restore()
+
+    def _button_at(self, pos: QPoint, option_rect: QRect) -> Optional[str]:
+        rect = option_rect.adjusted(0, 1, -1, -1)
+        for name, button_rect in self._button_rects(rect).items():
+            if button_rect.contains(pos):
+                return name
+        return None
+
+    def editorEvent(self, event, model, option, index) -> bool:
+        if event.type() == QEvent.Type.MouseButtonPress:
+            if event.button() == Qt.MouseButton.LeftButton:
+                button = self._button_at(event.position().toPoint(), option.rect)
+                if button:
+                    self._pressed_button = (index.row(), button)
+                    return True  # Keep the view from selecting/dragging
+            self._pressed_button = None
+            return False
+
+        if event.type() == QEvent.Type.MouseButtonRelease:
+            if event.button() != Qt.MouseButton.LeftButton:
+                return False
+            button = self._button_at(event.position().toPoint(), option.rect)
+            pressed = self._pressed_button
+            self._pressed_button = None
+            if button and pressed == (index.row(), button):
+                domain = index.data(DOMAIN_ROLE)
+                if button == "dns":
+                    self.dns_clicked.emit(domain)
+                elif button == "copy":
+                    self._copy_domain(domain, event, option)
+                elif button == "remove":
+                    self.remove_clicked.emit(domain)
+                return True
+            return False
+
+        return super().editorEvent(event, model, option, index)
+
+    def _copy_domain(self, domain: str, event, option):
+        """Copy the domain name to clipboard with tooltip feedback."""
+        QApplication.clipboard().setText(domain)
+        view = option.widget
+        if view is not None:
+            QToolTip.showText(
+                view.mapToGlobal(event.position().toPoint()),
+                f"복사됨: {domain}",
+                view,
+                QRect(),
+                2000,
+            )
+
+    def helpEvent(self, event, view, option, index) -> bool:
+        """Show per-button tooltips when hovering over the drawn buttons."""
+        button = self._button_at(event.pos(), option.rect)
+        if button:
+            QToolTip.showText(event.globalPos(), self.BUTTON_TOOLTIPS[button], view)
+            return True
+        return super().helpEvent(event, view, option, index)
+
+
+class DomainListView(QListView):
+    """QListView configured for the dashboard domain panels."""
+
+    def __init__(self, model: DomainListModel, delegate: DomainItemDelegate,
+                 multi_select: bool = False, parent=None):
+        super().__init__(parent)
+        self.setModel(model)
+        self.setItemDelegate(delegate)
+        self.setMouseTracking(True)  # Hover highlight in the delegate
+        self.setDragEnabled(True)
+        self.setDragDropMode(QAbstractItemView.DragDropMode.DragOnly)
+        self.setDefaultDropAction(Qt.DropAction.MoveAction)
+        if multi_select:
+            self.setSelectionMode(QAbstractItemView.SelectionMode.ExtendedSelection)
+        else:
+            self.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
+        self.setVerticalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
+        # Every row is ROW_HEIGHT tall, so let Qt skip the per-row sizeHint
+        # pass; combined with QListView's viewport-only painting this keeps
+        # scrolling and relayout O(visible rows) instead of O(all domains).
+        self.setUniformItemSizes(True)
+        self.setSpacing(1)
 
 
 class DomainGroup(QFrame):
@@ -273,214 +371,147 @@ class DomainGroup(QFrame):
     group_deleted = pyqtSignal(str)
     group_renamed = pyqtSignal(str, str)  # old_name, new_name
     domain_removed = pyqtSignal(str)  # Signal when domain is removed from group
-    
+
     def __init__(self, name: str, color: str = "#f0f0f0", parent=None):
         super().__init__(parent)
         self.name = name
         self.color = color
         self.domains = []
+        self._domain_set = set()  # Mirrors self.domains for O(1) membership
+        # Pre-seed widgets touched by update_* helpers so the guards are a
+        # plain None check instead of hasattr's getattr+exception dance
+        self.count_label = None
+        self.copy_group_btn = None
+        # True while a drag hovers this group; gates the restyle so
+        # repeated enter events do not re-polish the subtree
+        self._drag_hot = False
         self.setup_ui()
         self.setAcceptDrops(True)
-        
+
     def setup_ui(self):
         self.setFrameStyle(QFrame.Shape.Box)
         self.setMinimumHeight(160)
         self.setMinimumWidth(240)
         self.setMaximumWidth(280)
         self.update_style()
-        
+
         layout = QVBoxLayout()
         layout.setContentsMargins(6, 6, 6, 6)
-        
+
         # Header
         header_layout = QHBoxLayout()
-        
+
         # Group name label
         self.name_label = QLabel(self.name)
-        self.name_label.setStyleSheet("""
-            font-weight: 600;
-            font-size: 14px;
-            color: #212529;
-            padding: 2px 6px;
-            font-family: 'Segoe UI', Arial, sans-serif;
-        """)
+        self.name_label.setObjectName("groupNameLabel")
         header_layout.addWidget(self.name_label)
 
         # Domain count badge
         self.count_label = QLabel()
-        self.count_label.setStyleSheet("""
-            color: #6c757d;
-            font-size: 11px;
-            padding: 2px 8px;
-            border-radius: 10px;
-            background: #e9ecef;
-            font-family: 'Segoe UI', Arial, sans-serif;
-        """)
+        self.count_label.setObjectName("groupCountLabel")
         header_layout.addWidget(self.count_label)
-        
+
         header_layout.addStretch()
 
         # Group-level copy button
         self.copy_group_btn = QToolButton()
         self.copy_group_btn.setText("📋")
-        self.copy_group_btn.setStyleSheet("""
-            QToolButton {
-                background: #17a2b8;
-                color: white;
-                border: none;
-                border-radius: 3px;
-                padding: 2px 4px;
-                font-size: 11px;
-                font-weight: 500;
-                font-family: 'Segoe UI', Arial, sans-serif;
-            }
-            QToolButton:hover {
-                background: #117a8b;
-            }
-            QToolButton:disabled {
-                background: #cfe2f3;
-                color: #6c757d;
-            }
-        """)
+        self.copy_group_btn.setObjectName("groupCopyBtn")
         self.copy_group_btn.setCursor(Qt.CursorShape.PointingHandCursor)
         self.copy_group_btn.setToolTip("그룹 도메인 전체 복사")
         self.copy_group_btn.clicked.connect(self.copy_group_domains)
         header_layout.addWidget(self.copy_group_btn)
-        
+
         # Settings button
         self.settings_btn = QToolButton()
         self.settings_btn.setText("⋯")
-        self.settings_btn.setStyleSheet("""
-            QToolButton {
-                border: none;
-                font-size: 12px;
-                background: transparent;
-                border-radius: 3px;
-                padding: 2px;
-                color: #6c757d;
-            }
-            QToolButton:hover {
-                background: #e9ecef;
-                color: #495057;
-            }
-        """)
+        self.settings_btn.setObjectName("groupSettingsBtn")
         self.settings_btn.clicked.connect(self.show_context_menu)
         header_layout.addWidget(self.settings_btn)
-        
+
         layout.addLayout(header_layout)
-        
-        # Domains container with scroll
-        scroll = QScrollArea()
-        scroll.setWidgetResizable(True)
-        scroll.setStyleSheet("""
-            QScrollArea {
-                border: none;
-                background-color: transparent;
-            }
-        """)
-        
-        self.domains_container = QWidget()
-        self.domains_layout = QVBoxLayout()
-        self.domains_layout.setAlignment(Qt.AlignmentFlag.AlignTop)
-        self.domains_container.setLayout(self.domains_layout)
-        scroll.setWidget(self.domains_container)
-        
-        layout.addWidget(scroll)
-        
+
+        # Domain list (model/view: one view renders all rows, no per-domain widgets)
+        self.domains_model = DomainListModel(self)
+        self.domains_delegate = DomainItemDelegate(show_remove=True, parent=self)
+        self.domains_delegate.dns_clicked.connect(self.domain_clicked.emit)
+        self.domains_delegate.remove_clicked.connect(self.handle_remove_domain)
+        self.domains_view = DomainListView(self.domains_model, self.domains_delegate)
+        layout.addWidget(self.domains_view)
+
         # Drop hint label (shown when empty)
         self.drop_hint = QLabel("여기에 도메인을 드래그하세요")
         self.drop_hint.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.drop_hint.setStyleSheet("""
-            color: #6c757d;
-            font-style: italic;
-            font-size: 12px;
-            padding: 12px;
-            background: transparent;
-            border: 1px dashed #dee2e6;
-            border-radius: 4px;
-            margin: 4px;
-            font-family: 'Segoe UI', Arial, sans-serif;
-        """)
-        self.domains_layout.addWidget(self.drop_hint)
-        
+        self.drop_hint.setObjectName("groupDropHint")
+        layout.addWidget(self.drop_hint)
+
         self.setLayout(layout)
         self.update_copy_button_state()
         self.update_count_label()
-        
+
     def update_style(self):
-        # Subtle professional styling
-        color = QColor(self.color)
-        
-        self.setStyleSheet(f"""
-            DomainGroup {{
-                background: {self.color};
-                border: 1px solid #dee2e6;
-                border-radius: 6px;
-                margin: 2px;
-            }}
-            DomainGroup:hover {{
-                border: 1px solid #adb5bd;
-            }}
-        """)
-        
+        # Subtle professional styling (formatted sheet cached per color)
+        self.setStyleSheet(_group_style(self.color))
+
     def add_domain(self, domain: str, is_porkbun: bool = True):
-        if domain not in self.domains:
+        if domain not in self._domain_set:
             self.domains.append(domain)
-            
+            self._domain_set.add(domain)
+
             # Hide drop hint
             self.drop_hint.hide()
-            
-            # Add domain item with remove button
-            domain_item = DomainItem(domain, show_remove=True, is_porkbun_ns=is_porkbun)
-            domain_item.clicked.connect(self.domain_clicked.emit)
-            domain_item.remove_clicked.connect(self.handle_remove_domain)
-            self.domains_layout.addWidget(domain_item)
+
+            self.domains_model.add_row(domain, is_porkbun)
             self.update_copy_button_state()
             self.update_count_label()
-    
+
+    def set_domains(self, rows: List[Tuple[str, bool]]):
+        """Replace the group contents in one model reset."""
+        self.domains = [domain for domain, _ in rows]
+        self._domain_set = set(self.domains)
+        self.domains_model.set_rows(rows)
+        self.drop_hint.setVisible(not self.domains)
+        self.update_copy_button_state()
+        self.update_count_label()
+
     def handle_remove_domain(self, domain: str):
         """Handle domain removal from group"""
         self.remove_domain(domain)
         # Emit signal to parent widget
         self.domain_removed.emit(domain)
-            
+
     def remove_domain(self, domain: str):
-        if domain in self.domains:
+        if domain in self._domain_set:
             self.domains.remove(domain)
-            
-            # Remove domain widget
-            for i in range(self.domains_layout.count()):
-                widget = self.domains_layout.itemAt(i).widget()
-                if isinstance(widget, DomainItem) and widget.domain == domain:
-                    widget.deleteLater()
-                    break
-                    
-            # Show drop hint if empty (but make sure drop_hint still exists)
-            if not self.domains and hasattr(self, 'drop_hint'):
+            self._domain_set.discard(domain)
+            self.domains_model.remove_domain(domain)
+
+            # Show drop hint if empty
+            if not self.domains:
                 self.drop_hint.show()
         self.update_copy_button_state()
         self.update_count_label()
 
     def update_count_label(self):
-        if hasattr(self, "count_label"):
+        if self.count_label is not None:
             self.count_label.setText(f"{len(self.domains)}개")
 
     def show_context_menu(self):
         menu = QMenu(self)
-        
+
         rename_action = menu.addAction("이름 변경")
         rename_action.triggered.connect(self.rename_group)
-        
+
         color_action = menu.addAction("색상 변경")
         color_action.triggered.connect(self.change_color)
-        
+
         menu.addSeparator()
-        
+
         delete_action = menu.addAction("그룹 삭제")
         delete_action.triggered.connect(lambda: self.group_deleted.emit(self.name))
-        
+
         menu.exec(self.settings_btn.mapToGlobal(QPoint(0, self.settings_btn.height())))
-        
+
     def rename_group(self):
         text, ok = QInputDialog.getText(self, "그룹 이름 변경", "새 이름:", text=self.name)
         if ok and text and text != self.name:
@@ -489,40 +520,44 @@ class DomainGroup(QFrame):
     def apply_name(self, new_name: str):
         self.name = new_name
         self.name_label.setText(new_name)
-            
+
     def change_color(self):
         color = QColorDialog.getColor(QColor(self.color), self, "그룹 색상 선택")
         if color.isValid():
             self.color = color.name()
             self.update_style()
-            
+
     def dragEnterEvent(self, event: QDragEnterEvent):
         if event.mimeData().hasText():
             event.acceptProposedAction()
-            # Highlight during drag
-            self.setStyleSheet(f"""
-                DomainGroup {{
-                    background: {self.color};
-                    border: 2px solid #007bff;
-                    border-radius: 6px;
-                    margin: 2px;
-                }}
-            """)
-            
+            # Highlight once per hover; Qt can re-enter rapidly while the
+            # cursor crosses child widget boundaries
+            if not self._drag_hot:
+                self._drag_hot = True
+                self.setStyleSheet(_group_drag_style(self.color))
+
+    def dragMoveEvent(self, event):
+        event.acceptProposedAction()
+
+    def _end_drag_highlight(self):
+        if self._drag_hot:
+            self._drag_hot = False
+            self.update_style()
+
     def dragLeaveEvent(self, event):
-        self.update_style()
-        
+        self._end_drag_highlight()
+
     def dropEvent(self, event: QDropEvent):
         text = event.mimeData().text().strip()
         domains = [d.strip() for d in text.splitlines() if d.strip()]
         if not domains:
-            self.update_style()
+            self._end_drag_highlight()
             return
 
         for domain in domains:
             self.domain_dropped.emit(domain, self.name)
         event.acceptProposedAction()
-        self.update_style()
+        self._end_drag_highlight()
 
     def copy_group_domains(self):
         """Copy all domains in this group separated by newlines"""
@@ -547,182 +582,173 @@ class DomainGroup(QFrame):
         )
 
     def update_copy_button_state(self):
-        if hasattr(self, "copy_group_btn"):
+        if self.copy_group_btn is not None:
             self.copy_group_btn.setEnabled(bool(self.domains))
 
 
+class _StoreLoadSignals(QObject):
+    """Signal bridge for _StoreLoadTask (QRunnable cannot emit directly)."""
+    loaded = pyqtSignal(dict)
+
+
+class _StoreLoadTask(QRunnable):
+    """Reads and parses the dashboard store off the UI thread.
+
+    시작 시 디스크 읽기와 JSON 파싱이 이벤트 루프를 막지 않도록 스레드
+    풀에서 수행하고, 파싱된 dict만 UI 스레드로 전달한다.
+    """
+
+    def __init__(self, path: Path):
+        super().__init__()
+        self.path = path
+        self.signals = _StoreLoadSignals()
+
+    def run(self):
+        data: Dict[str, Any] = {}
+        try:
+            if self.path.exists():
+                loaded = load_json(self.path)
+                if isinstance(loaded, dict):
+                    data = loaded
+        except Exception:
+            data = {}
+        self.signals.loaded.emit(data)
+
+
+class _SaveStoreSignals(QObject):
+    """Signal bridge for _SaveStoreTask (QRunnable cannot emit directly)."""
+    finished = pyqtSignal()
+    error = pyqtSignal(str)
+
+
+class _SaveStoreTask(QRunnable):
+    """Writes pre-serialized store bytes to disk off the UI thread.
+
+    직렬화는 GUI 스레드에서 스냅샷으로 끝내고, 임시 파일 기록과
+    os.replace만 풀에서 수행하므로 드래그 직후 fsync 구간에 UI가
+    멈추지 않는다.
+    """
+
+    def __init__(self, path: Path, payload: bytes):
+        super().__init__()
+        self.path = path
+        self.payload = payload
+        self.signals = _SaveStoreSignals()
+
+    def run(self):
+        try:
+            write_bytes_atomic(self.path, self.payload)
+        except Exception as e:
+            self.signals.error.emit(str(e))
+        else:
+            self.signals.finished.emit()
+
+
 class DashboardWidget(QWidget):
     """Main Dashboard Widget for managing domain groups"""
     domain_selected = pyqtSignal(str)
-    
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.groups = {}  # {group_name: DomainGroup}
         self.all_domains = []
+        # Set twin of all_domains, maintained in set_domains, so every
+        # membership test skips an O(n) rebuild of the set
+        self._all_domains_set: set = set()
         self.domain_info = {}  # {domain: {"is_porkbun": bool}}
-        self.selection_anchor_domain: Optional[str] = None
-        self.dashboard_store_file = Path.home() / ".porkbun_dns" / "dashboard_profiles.json"
-        self.legacy_config_file = Path.home() / ".porkbun_dashboard.json"
+        # Domains known to use external nameservers, derived from
+        # domain_info so hot paths avoid the dict-of-dict get chain
+        self._external_ns_domains = frozenset()
+        # O(1) lookup of where a domain currently lives:
+        # {domain: group_name} for grouped, {domain: None} for ungrouped
+        self.domain_locations: Dict[str, Optional[str]] = {}
+        self.dashboard_store_file = DASHBOARD_STORE_FILE
+        self.legacy_config_file = LEGACY_DASHBOARD_FILE
         self.profile_id = "__default__"
-        self.dashboard_store = self._load_store()
+        # Placeholder until the async store load lands; default groups are
+        # shown immediately and replaced once the real data is parsed
+        self.dashboard_store = {"profiles": {}}
+        self._store_loaded = False
+        # Coalesce bursts of mutations (drag of N domains, group deletes)
+        # into a single disk write
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(400)
+        self._save_timer.timeout.connect(self.save_config_now)
+        # setup_ui에서 만들기 전에 미리 초기화 (hasattr 가드 대신 None 체크)
+        self.ungrouped_label = None
+        # One store write on the pool at a time; overlapping requests
+        # re-arm the debounce so the last state still lands on disk
+        self._save_in_flight = False
+        self._save_store_task = None
+        # 종료 시 디바운스 창 안에 걸려 있는 저장이 유실되지 않게 한다
+        app = QApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self._flush_pending_save)
         self.setup_ui()
         self.load_config()
-        
+        self._start_store_load()
+
     def setup_ui(self):
         layout = QVBoxLayout()
         layout.setContentsMargins(8, 8, 8, 8)
         layout.setSpacing(6)
-        
-        # Add background styling to main widget
-        self.setStyleSheet("""
-            DashboardWidget {
-                background: #f8f9fa;
-                font-family: 'Segoe UI', Arial, sans-serif;
-            }
-        """)
-        
+
+        # 배경 등 정적 스타일은 앱 스타일시트(lib/theme.py)에서 내려온다
+
         # Toolbar
         toolbar_layout = QHBoxLayout()
-        
+
         self.add_group_btn = QPushButton("+ 새 그룹")
-        self.add_group_btn.setStyleSheet("""
-            QPushButton {
-                background: #007bff;
-                color: white;
-                border: none;
-                border-radius: 4px;
-                padding: 6px 12px;
-                font-size: 12px;
-                font-weight: 500;
-                font-family: 'Segoe UI', Arial, sans-serif;
-            }
-            QPushButton:hover {
-                background: #0056b3;
-            }
-        """)
+        self.add_group_btn.setObjectName("dashAddGroupBtn")
         self.add_group_btn.clicked.connect(self.add_group)
         toolbar_layout.addWidget(self.add_group_btn)
-        
+
         # Status info label
         self.status_label = QLabel("도메인 관리 대시보드")
-        self.status_label.setStyleSheet("""
-            color: #6c757d;
-            font-size: 11px;
-            padding: 2px 6px;
-            font-family: 'Segoe UI', Arial, sans-serif;
-        """)
+        self.status_label.setObjectName("dashStatusLabel")
         toolbar_layout.addWidget(self.status_label)
-        
+
         toolbar_layout.addStretch()
-        
+
         self.save_btn = QPushButton("저장")
-        self.save_btn.setStyleSheet("""
-            QPushButton {
-                background: #28a745;
-                color: white;
-                border: none;
-                border-radius: 4px;
-                padding: 6px 12px;
-                font-size: 12px;
-                font-weight: 500;
-                font-family: 'Segoe UI', Arial, sans-serif;
-            }
-            QPushButton:hover {
-                background: #1e7e34;
-            }
-        """)
-        self.save_btn.clicked.connect(self.save_config)
+        self.save_btn.setObjectName("dashSaveBtn")
+        self.save_btn.clicked.connect(self.save_config_now)
         toolbar_layout.addWidget(self.save_btn)
-        
+
         layout.addLayout(toolbar_layout)
-        
+
         # Main content area
         self.splitter = QSplitter(Qt.Orientation.Horizontal)
-        
+
         # Ungrouped domains panel with modern design
         ungrouped_frame = QFrame()
         ungrouped_frame.setFrameStyle(QFrame.Shape.Box)
         ungrouped_frame.setMinimumWidth(250)
         ungrouped_frame.setMaximumWidth(350)
-        ungrouped_frame.setStyleSheet("""
-            QFrame {
-                background: #ffffff;
-                border: 1px solid #dee2e6;
-                border-radius: 6px;
-                margin: 2px;
-            }
-        """)
+        ungrouped_frame.setObjectName("ungroupedFrame")
         ungrouped_layout = QVBoxLayout()
-        
+
         self.ungrouped_label = QLabel("미분류 도메인")
-        self.ungrouped_label.setStyleSheet("""
-            font-weight: 600;
-            font-size: 12px;
-            color: #495057;
-            padding: 6px 8px;
-            background: #f8f9fa;
-            border-bottom: 1px solid #dee2e6;
-            font-family: 'Segoe UI', Arial, sans-serif;
-        """)
+        self.ungrouped_label.setObjectName("ungroupedLabel")
         ungrouped_layout.addWidget(self.ungrouped_label)
-        
-        self.ungrouped_scroll = QScrollArea()
-        self.ungrouped_scroll.setWidgetResizable(True)
-        self.ungrouped_scroll.setStyleSheet("""
-            QScrollArea {
-                border: none;
-                background-color: transparent;
-            }
-            QScrollBar:vertical {
-                border: none;
-                background: #f8f9fa;
-                width: 4px;
-            }
-            QScrollBar::handle:vertical {
-                background: #dee2e6;
-                border-radius: 2px;
-                min-height: 10px;
-            }
-            QScrollBar::handle:vertical:hover {
-                background: #adb5bd;
-            }
-        """)
-        self.ungrouped_container = QWidget()
-        self.ungrouped_layout = QVBoxLayout()
-        self.ungrouped_layout.setAlignment(Qt.AlignmentFlag.AlignTop)
-        self.ungrouped_layout.setSpacing(4)
-        self.ungrouped_layout.setContentsMargins(8, 8, 8, 8)
-        self.ungrouped_container.setLayout(self.ungrouped_layout)
-        self.ungrouped_scroll.setWidget(self.ungrouped_container)
-        ungrouped_layout.addWidget(self.ungrouped_scroll)
-        
+
+        # Ungrouped list (model/view, multi-select with Shift/Ctrl built in)
+        self.ungrouped_model = DomainListModel(self)
+        self.ungrouped_delegate = DomainItemDelegate(show_remove=False, parent=self)
+        self.ungrouped_delegate.dns_clicked.connect(self.domain_selected.emit)
+        self.ungrouped_view = DomainListView(
+            self.ungrouped_model, self.ungrouped_delegate, multi_select=True
+        )
+        ungrouped_layout.addWidget(self.ungrouped_view)
+
         ungrouped_frame.setLayout(ungrouped_layout)
         self.splitter.addWidget(ungrouped_frame)
-        
+
         # Groups panel with enhanced styling
         self.groups_scroll = QScrollArea()
         self.groups_scroll.setWidgetResizable(True)
-        self.groups_scroll.setStyleSheet("""
-            QScrollArea {
-                background: #ffffff;
-                border: 1px solid #dee2e6;
-                border-radius: 6px;
-                margin: 2px;
-            }
-            QScrollBar:horizontal {
-                border: none;
-                background: #f8f9fa;
-                height: 6px;
-            }
-            QScrollBar::handle:horizontal {
-                background: #dee2e6;
-                border-radius: 3px;
-                min-width: 15px;
-            }
-            QScrollBar::handle:horizontal:hover {
-                background: #adb5bd;
-            }
-        """)
+        self.groups_scroll.setObjectName("groupsScroll")
         self.groups_container = QWidget()
         self.groups_layout = QHBoxLayout()
         self.groups_layout.setAlignment(Qt.AlignmentFlag.AlignLeft)
@@ -740,37 +766,66 @@ class DashboardWidget(QWidget):
     # ------------------------------------------------------------------
     # Profile-aware persistence helpers
     # ------------------------------------------------------------------
-    def _load_store(self) -> Dict[str, Any]:
+    def _start_store_load(self):
+        """Read the dashboard store on a pool thread, then apply it."""
+        self._store_load_task = _StoreLoadTask(self.dashboard_store_file)
+        self._store_load_task.signals.loaded.connect(self._on_store_loaded)
+        QThreadPool.globalInstance().start(self._store_load_task)
+
+    def _on_store_loaded(self, loaded: Dict[str, Any]):
+        """Validate the parsed store on the UI thread and rebuild."""
         data = {"profiles": {}}
-        if self.dashboard_store_file.exists():
-            try:
-                with open(self.dashboard_store_file, 'r', encoding='utf-8') as f:
-                    loaded = json.load(f)
-                    if isinstance(loaded, dict):
-                        data.update(loaded)
-            except Exception:
-                pass
+        data.update(loaded)
 
         if "profiles" not in data or not isinstance(data["profiles"], dict):
             data["profiles"] = {}
 
+        migrated = False
         if not data["profiles"] and self.legacy_config_file.exists():
             try:
-                with open(self.legacy_config_file, 'r', encoding='utf-8') as f:
-                    legacy = json.load(f)
-                    if isinstance(legacy, dict):
-                        data["profiles"][self.profile_id] = legacy
-                        self._save_store(data)
+                legacy = load_json(self.legacy_config_file)
+                if isinstance(legacy, dict):
+                    data["profiles"][self.profile_id] = legacy
+                    migrated = True
             except Exception:
                 pass
 
-        return data
+        self.dashboard_store = data
+        self._store_loaded = True
+        if migrated:
+            self._save_store(data)
+        self.load_config()
+
+    def _save_store(self, data: Optional[Dict[str, Any]] = None,
+                    blocking: bool = False):
+        if blocking:
+            # 종료 경로: 풀 작업과 큐드 시그널이 더 이상 돌지 않으므로
+            # 호출 스레드에서 바로 기록한다
+            write_bytes_atomic(
+                self.dashboard_store_file,
+                serialize_json(data or self.dashboard_store),
+            )
+            return
+        if self._save_in_flight:
+            # 이전 기록이 끝나는 대로 최신 상태를 다시 저장한다
+            self._save_timer.start()
+            return
+        # GUI 스레드에서 직렬화해 스냅샷을 뜨므로, 기록 중에 그룹이
+        # 더 바뀌거나 프로필이 전환돼도 넘어간 바이트는 일관적이다
+        payload = serialize_json(data or self.dashboard_store)
+        self._save_in_flight = True
+        task = _SaveStoreTask(self.dashboard_store_file, payload)
+        task.signals.finished.connect(self._on_save_store_done)
+        task.signals.error.connect(self._on_save_store_error)
+        self._save_store_task = task
+        QThreadPool.globalInstance().start(task)
+
+    def _on_save_store_done(self):
+        self._save_in_flight = False
 
-    def _save_store(self, data: Optional[Dict[str, Any]] = None):
-        payload = data or self.dashboard_store
-        self.dashboard_store_file.parent.mkdir(parents=True, exist_ok=True)
-        with open(self.dashboard_store_file, 'w', encoding='utf-8') as f:
-            json.dump(payload, f, indent=2, ensure_ascii=False)
+    def _on_save_store_error(self, message: str):
+        self._save_in_flight = False
+        QMessageBox.warning(self, "저장 실패", f"설정 저장 실패: {message}")
 
     def _ensure_profile_bucket(self):
         self.dashboard_store.setdefault("profiles", {})
@@ -781,6 +836,9 @@ class DashboardWidget(QWidget):
         new_id = profile_id or "__default__"
         if new_id == self.profile_id:
             return
+        # Flush any pending debounced save before leaving the old profile
+        if self._save_timer.isActive():
+            self.save_config_now()
         self.profile_id = new_id
         self._ensure_profile_bucket()
         self.load_config()
@@ -815,7 +873,7 @@ class DashboardWidget(QWidget):
         ]
         for name, color in default_groups:
             self.create_group(name, color)
-        
+
     def add_group(self):
         text, ok = QInputDialog.getText(self, "새 그룹", "그룹 이름:")
         if ok and text and text not in self.groups:
@@ -827,7 +885,7 @@ class DashboardWidget(QWidget):
                 # Use default color if user cancels color selection
                 self.create_group(text, "#f8f9fa")
                 self.save_config()
-                
+
     def handle_group_renamed(self, old_name: str, new_name: str):
         new_name = (new_name or "").strip()
         key, group = self._get_group_entry(old_name)
@@ -845,8 +903,10 @@ class DashboardWidget(QWidget):
         elif not key:
             self.groups[new_name] = group
         group.apply_name(new_name)
+        for domain in group.domains:
+            self.domain_locations[domain] = new_name
         self.save_config()
-        
+
     def create_group(self, name: str, color: str = "#f8f9fa"):
         group = DomainGroup(name, color)
         group.domain_dropped.connect(self.handle_domain_drop)
@@ -854,248 +914,212 @@ class DashboardWidget(QWidget):
         group.group_deleted.connect(self.delete_group)
         group.group_renamed.connect(self.handle_group_renamed)
         group.domain_removed.connect(self.handle_domain_removed)
-        
+
         self.groups[name] = group
         self.groups_layout.addWidget(group)
         return group
-        
+
     def delete_group(self, name: str):
-        reply = QMessageBox.question(self, "그룹 삭제", 
+        reply = QMessageBox.question(self, "그룹 삭제",
                                     f"'{name}' 그룹을 삭제하시겠습니까?\n그룹 내 도메인은 미분류로 이동합니다.",
                                     QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No)
-        
+
         if reply == QMessageBox.StandardButton.Yes:
             key, group = self._get_group_entry(name)
             if group:
-                
-                # Move domains back to ungrouped
-                for domain in group.domains[:]:
-                    self.add_ungrouped_domain(domain)
-                    
+                # Move domains back to ungrouped; suspend repaints so the
+                # N inserts coalesce into one relayout/paint at the end
+                self.setUpdatesEnabled(False)
+                try:
+                    for domain in group.domains[:]:
+                        self.add_ungrouped_domain(domain)
+                finally:
+                    self.setUpdatesEnabled(True)
+
                 # Remove group
                 group.deleteLater()
                 if key and key in self.groups:
                     del self.groups[key]
                 self.save_config()
-                
+
     def handle_domain_drop(self, domain: str, group_name: str):
         # Remove from all other groups and ungrouped
         self.remove_domain_from_all(domain)
-        
+
         # Add to target group with nameserver status
         _, target_group = self._get_group_entry(group_name)
         if target_group:
-            is_porkbun = self.domain_info.get(domain, {}).get("is_porkbun", True)
-            target_group.add_domain(domain, is_porkbun)
+            target_group.add_domain(domain, self._is_porkbun(domain))
+            self.domain_locations[domain] = group_name
             self.save_config()
-    
+
     def handle_domain_removed(self, domain: str):
         """Handle domain removal from a group - move back to ungrouped"""
         self.add_ungrouped_domain(domain)
         self.save_config()
-            
-    def remove_domain_from_all(self, domain: str):
-        # Remove from ungrouped
-        for i in range(self.ungrouped_layout.count()):
-            widget = self.ungrouped_layout.itemAt(i).widget()
-            if isinstance(widget, DomainItem) and widget.domain == domain:
-                self._remove_domain_from_selection(domain)
-                widget.deleteLater()
-                break
-        self.update_ungrouped_count()
-                
-        # Remove from all groups
-        for group in self.groups.values():
-            group.remove_domain(domain)
-            
-    def add_ungrouped_domain(self, domain: str):
-        # Check if already exists in ungrouped
-        for i in range(self.ungrouped_layout.count()):
-            widget = self.ungrouped_layout.itemAt(i).widget()
-            if isinstance(widget, DomainItem) and widget.domain == domain:
-                return  # Already exists
-        
-        # Check nameserver status
-        is_porkbun = self.domain_info.get(domain, {}).get("is_porkbun", True)
-        
-        domain_item = DomainItem(
-            domain,
-            show_remove=False,
-            is_porkbun_ns=is_porkbun,
-            selection_enabled=True,
-            selection_provider=self.get_selected_ungrouped_domains,
-        )
-        domain_item.clicked.connect(self.domain_selected.emit)
-        domain_item.selection_requested.connect(self.handle_ungrouped_selection)
-        self.ungrouped_layout.addWidget(domain_item)
-        self.update_ungrouped_count()
 
-    def _get_ungrouped_domain_widgets(self) -> List[DomainItem]:
-        widgets: List[DomainItem] = []
-        if not hasattr(self, "ungrouped_layout"):
-            return widgets
-        for i in range(self.ungrouped_layout.count()):
-            widget = self.ungrouped_layout.itemAt(i).widget()
-            if isinstance(widget, DomainItem):
-                widgets.append(widget)
-        return widgets
-
-    def get_selected_ungrouped_domains(self) -> List[str]:
-        return [widget.domain for widget in self._get_ungrouped_domain_widgets() if widget.is_selected()]
-
-    def clear_ungrouped_selection(self):
-        for widget in self._get_ungrouped_domain_widgets():
-            if widget.is_selected():
-                widget.set_selected(False)
-        self.selection_anchor_domain = None
-
-    def _find_ungrouped_index(
-        self,
-        domain: Optional[str],
-        widgets: Optional[List[DomainItem]] = None,
-    ) -> Optional[int]:
-        if not domain:
-            return None
-        widgets = widgets or self._get_ungrouped_domain_widgets()
-        for index, widget in enumerate(widgets):
-            if widget.domain == domain:
-                return index
-        return None
-
-    def handle_ungrouped_selection(self, domain_item: DomainItem, modifiers):
-        widgets = self._get_ungrouped_domain_widgets()
-        if not widgets or domain_item not in widgets:
+    def remove_domain_from_all(self, domain: str):
+        location = self.domain_locations.pop(domain, False)
+        if location is False:
+            # Unknown domain: fall back to checking every container
+            self.ungrouped_model.remove_domain(domain)
+            self.update_ungrouped_count()
+            for group in self.groups.values():
+                group.remove_domain(domain)
             return
 
-        index = widgets.index(domain_item)
-        shift_pressed = bool(modifiers & Qt.KeyboardModifier.ShiftModifier)
-        additive = bool(
-            modifiers & (Qt.KeyboardModifier.ControlModifier | Qt.KeyboardModifier.MetaModifier)
-        )
-
-        if shift_pressed:
-            anchor_index = self._find_ungrouped_index(self.selection_anchor_domain, widgets)
-            if anchor_index is None:
-                self.selection_anchor_domain = domain_item.domain
-                anchor_index = index
-
-            start = min(anchor_index, index)
-            end = max(anchor_index, index)
-            for i, widget in enumerate(widgets):
-                widget.set_selected(start <= i <= end)
-        elif additive:
-            domain_item.set_selected(not domain_item.is_selected())
-            if domain_item.is_selected():
-                self.selection_anchor_domain = domain_item.domain
+        if location is None:
+            # Ungrouped
+            self.ungrouped_model.remove_domain(domain)
+            self.update_ungrouped_count()
         else:
-            self.clear_ungrouped_selection()
-            domain_item.set_selected(True)
-            self.selection_anchor_domain = domain_item.domain
+            _, group = self._get_group_entry(location)
+            if group:
+                group.remove_domain(domain)
+
+    def add_ungrouped_domain(self, domain: str):
+        # Check if already exists in ungrouped
+        if self.ungrouped_model.contains(domain):
+            return  # Already exists
 
-        selected = self.get_selected_ungrouped_domains()
-        if not selected:
-            self.selection_anchor_domain = None
-        elif self.selection_anchor_domain not in selected:
-            self.selection_anchor_domain = selected[0]
+        self.ungrouped_model.add_row(domain, self._is_porkbun(domain))
+        self.domain_locations[domain] = None
+        self.update_ungrouped_count()
 
-    def _remove_domain_from_selection(self, domain: str):
-        if self.selection_anchor_domain == domain:
-            remaining = [d for d in self.get_selected_ungrouped_domains() if d != domain]
-            self.selection_anchor_domain = remaining[0] if remaining else None
+    def get_selected_ungrouped_domains(self) -> List[str]:
+        selection = self.ungrouped_view.selectionModel()
+        if selection is None:
+            return []
+        return [index.data(DOMAIN_ROLE) for index in selection.selectedIndexes()]
 
     def set_domains(self, domains: List[str]):
         """Set the list of all domains"""
         self.all_domains = domains
+        self._all_domains_set = set(domains)
         self.refresh_domains()
-    
+
     def update_domain_info(self, domain_info: Dict[str, Dict]):
         """Update domain nameserver information"""
+        old_external = self._external_ns_domains
         self.domain_info = domain_info
-        self.refresh_domains()  # Refresh display with new info
-        
+        self._external_ns_domains = frozenset(
+            domain for domain, info in domain_info.items()
+            if not info.get("is_porkbun", True)
+        )
+
+        # Only restyle the rows whose nameserver status actually changed;
+        # a full panel rebuild is unnecessary for a status-only update.
+        for domain in old_external ^ self._external_ns_domains:
+            location = self.domain_locations.get(domain, False)
+            if location is False:
+                continue  # Not currently displayed
+            is_porkbun = self._is_porkbun(domain)
+            if location is None:
+                self.ungrouped_model.set_domain_status(domain, is_porkbun)
+            else:
+                _, group = self._get_group_entry(location)
+                if group:
+                    group.domains_model.set_domain_status(domain, is_porkbun)
+
+    def _is_porkbun(self, domain: str) -> bool:
+        return domain not in self._external_ns_domains
+
     def refresh_domains(self):
         """Refresh domain display based on current grouping"""
-        self.clear_ungrouped_selection()
-        # Clear ungrouped
-        while self.ungrouped_layout.count():
-            item = self.ungrouped_layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
-        self.update_ungrouped_count()
-        
+        # Suspend repaints while every panel is rebuilt; one paint at the end
+        self.setUpdatesEnabled(False)
+        try:
+            self._rebuild_domain_panels()
+        finally:
+            self.setUpdatesEnabled(True)
+
+    def _rebuild_domain_panels(self):
+        self.domain_locations.clear()
+
         # Refresh all group displays with updated nameserver info
         for group_name, group in self.groups.items():
-            # Clear current domains in group (but keep drop_hint)
-            for i in reversed(range(group.domains_layout.count())):
-                item = group.domains_layout.itemAt(i)
-                if item and item.widget() and isinstance(item.widget(), DomainItem):
-                    item.widget().deleteLater()
-            
-            # Re-add domains with updated status
-            domains_copy = group.domains.copy()
-            group.domains = []
-            group.update_count_label()
-            group.update_copy_button_state()
-            
-            # Show drop_hint if no domains
-            if not domains_copy and hasattr(group, 'drop_hint'):
-                group.drop_hint.show()
-            
-            for domain in domains_copy:
-                if domain in self.all_domains:
-                    is_porkbun = self.domain_info.get(domain, {}).get("is_porkbun", True)
-                    group.add_domain(domain, is_porkbun)
-        
+            rows = [
+                (domain, self._is_porkbun(domain))
+                for domain in group.domains
+                if domain in self._all_domains_set
+            ]
+            group.set_domains(rows)
+            for domain in group.domains:
+                self.domain_locations[domain] = group_name
+
         # Get grouped domains
         grouped_domains = set()
         for group in self.groups.values():
             grouped_domains.update(group.domains)
-            
-        # Add ungrouped domains
-        for domain in self.all_domains:
-            if domain not in grouped_domains:
-                self.add_ungrouped_domain(domain)
-                
+
+        # Rebuild ungrouped panel in one model reset
+        ungrouped_rows = [
+            (domain, self._is_porkbun(domain))
+            for domain in self.all_domains
+            if domain not in grouped_domains
+        ]
+        self.ungrouped_model.set_rows(ungrouped_rows)
+        for domain, _ in ungrouped_rows:
+            self.domain_locations[domain] = None
+        self.update_ungrouped_count()
+
     def update_ungrouped_count(self):
         """Update the label showing how many ungrouped domains exist."""
-        if not hasattr(self, "ungrouped_label"):
+        if self.ungrouped_label is None:
             return
-        count = 0
-        for i in range(self.ungrouped_layout.count()):
-            widget = self.ungrouped_layout.itemAt(i).widget()
-            if isinstance(widget, DomainItem):
-                count += 1
+        count = self.ungrouped_model.rowCount()
         self.ungrouped_label.setText(f"미분류 도메인 ({count}개)")
-                
+
     def save_config(self):
+        """Schedule a debounced save of the dashboard configuration."""
+        self._save_timer.start()
+
+    def _flush_pending_save(self):
+        """Write out a save still waiting in the debounce window."""
+        if self._save_timer.isActive():
+            self.save_config_now()
+        # 종료 직전이므로 풀로 넘어간 기록이 끝날 때까지 잠시 기다린다
+        QThreadPool.globalInstance().waitForDone(2000)
+        # 기록이 진행 중이어서 save_config_now가 타이머만 재가동했다면
+        # 이벤트 루프가 끝나는 중이라 그 타이머는 다시 못 돈다. 위의
+        # 대기는 이미 넘어간(낡은) 페이로드만 끝낸 것이므로 최신 상태를
+        # 여기서 동기적으로 기록한다. (_save_in_flight를 내리는 시그널도
+        # 큐에 묶여 있을 수 있어 비동기 경로는 믿을 수 없다.)
+        if self._save_timer.isActive() and self._store_loaded:
+            self.save_config_now(blocking=True)
+
+    def save_config_now(self, blocking: bool = False):
         """Save dashboard configuration"""
+        if not self._store_loaded:
+            # The store is still parsing on the pool; retry after it lands
+            # so the placeholder never clobbers other profiles on disk
+            self._save_timer.start()
+            return
+        self._save_timer.stop()
         self._ensure_profile_bucket()
         profile_entry = {
-            "groups": {}
-        }
-
-        for name, group in self.groups.items():
-            profile_entry["groups"][name] = {
-                "color": group.color,
-                "domains": group.domains
+            "groups": {
+                name: {"color": group.color, "domains": group.domains}
+                for name, group in self.groups.items()
             }
+        }
 
         self.dashboard_store["profiles"][self.profile_id] = profile_entry
 
         try:
-            self._save_store()
+            self._save_store(blocking=blocking)
         except Exception as e:
             QMessageBox.warning(self, "저장 실패", f"설정 저장 실패: {str(e)}")
-            
+
     def load_group_domains(self, group_name: str, domains: List[str]):
         """Load domains into a group"""
         key, group = self._get_group_entry(group_name)
         if group:
             for domain in domains:
-                if not self.all_domains or domain in self.all_domains:
-                    is_porkbun = self.domain_info.get(domain, {}).get("is_porkbun", True)
-                    group.add_domain(domain, is_porkbun)
-    
+                if not self.all_domains or domain in self._all_domains_set:
+                    group.add_domain(domain, self._is_porkbun(domain))
+                    self.domain_locations[domain] = key or group.name
+
     def load_config(self):
         """Load dashboard configuration for the current profile."""
         self._ensure_profile_bucket()
@@ -1113,5 +1137,6 @@ class DashboardWidget(QWidget):
             color = group_data.get("color", "#e3f2fd")
             group = self.create_group(name, color)
             group.domains = group_data.get("domains", []).copy()
+            group._domain_set = set(group.domains)
 
         self.refresh_domains()
@@ -1,14 +1,26 @@
 """Porkbun DNS API Client"""
-import json
 import requests
 from typing import Optional, Dict, List, Any
 # Removed unused dataclass import
 from enum import Enum
 
+from lib.config_io import dumps_json
+
 # API Keys - 개인용 로컬 프로그램
 API_KEY = "pk1_c0f4e0b1cbc592b54aa9c56a05bd10824f6da9e5ec812ad5c6c2124688437543"
 SECRET_API_KEY = "sk1_b8a48df931d9f078c15d3d13b17b963adc80fe775486b79240c84fd3c4e5edb4"
 
+# Porkbun's default nameservers (shared by the client and the NS worker)
+PORKBUN_DEFAULT_NAMESERVERS = (
+    "curitiba.ns.porkbun.com",
+    "fortaleza.ns.porkbun.com",
+    "maceio.ns.porkbun.com",
+    "salvador.ns.porkbun.com",
+)
+
+# Frozen membership view for hot "is this NS one of ours" checks
+PORKBUN_NAMESERVER_SET = frozenset(PORKBUN_DEFAULT_NAMESERVERS)
+
 
 class RecordType(Enum):
     """DNS record types supported by Porkbun"""
@@ -45,6 +57,19 @@ class PorkbunDNS:
         self.session.headers.update({
             'Content-Type': 'application/json'
         })
+        # 모든 호출이 api.porkbun.com 하나로 가므로 호스트 1개짜리
+        # 커넥션 풀을 넉넉히 잡아 병렬 호출 시 TLS 핸드셰이크를 재사용.
+        # Retry는 연결 수립 실패만 재시도한다 (POST 본문은 재전송 안 함)
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=32,
+            max_retries=requests.adapters.Retry(total=3, backoff_factor=0.3),
+        )
+        self.session.mount("https://", adapter)
+    
+    def close(self):
+        """Release the pooled connections"""
+        self.session.close()
     
     def _get_auth(self) -> Dict[str, str]:
         """Get authentication payload"""
@@ -80,7 +105,8 @@ class PorkbunDNS:
             response = self.session.request(
                 method=method,
                 url=url,
-                json=data
+                json=data,
+                timeout=15
             )
             
             # 500 에러 시 응답 본문 확인
@@ -153,8 +179,31 @@ class PorkbunDNS:
         Returns:
             List of domain information
         """
-        result = self._make_request("POST", "/domain/listAll")
-        return result.get("domains", [])
+        domains: List[Dict[str, Any]] = []
+        for page in self.iter_domains():
+            domains.extend(page)
+        return domains
+    
+    def iter_domains(self, page_size: int = 1000):
+        """Stream domains from the paginated listAll endpoint
+        
+        Args:
+            page_size: Domains per page (API maximum is 1000)
+            
+        Yields:
+            One list of domain information dicts per API page, so callers
+            can start working on the first page while later pages load
+        """
+        start = 0
+        while True:
+            result = self._make_request("POST", "/domain/listAll", {"start": str(start)})
+            page = result.get("domains", [])
+            if not page:
+                return
+            yield page
+            if len(page) < page_size:
+                return
+            start += len(page)
     
     # get_domain_info() method removed - unused code
     
@@ -255,13 +304,7 @@ class PorkbunDNS:
         Returns:
             List of Porkbun's default nameserver hostnames
         """
-        # Porkbun's default nameservers
-        return [
-            "curitiba.ns.porkbun.com",
-            "fortaleza.ns.porkbun.com",
-            "maceio.ns.porkbun.com",
-            "salvador.ns.porkbun.com"
-        ]
+        return list(PORKBUN_DEFAULT_NAMESERVERS)
     
     def is_using_porkbun_nameservers(self, nameservers: List[str]) -> bool:
         """Check if domain is using Porkbun's nameservers
@@ -272,10 +315,9 @@ class PorkbunDNS:
         Returns:
             True if using Porkbun nameservers
         """
-        porkbun_ns = self.get_default_nameservers()
         # Check if all nameservers are Porkbun's
         for ns in nameservers:
-            if not any(porkbun in ns.lower() for porkbun in ["porkbun.com"]):
+            if "porkbun.com" not in ns.lower():
                 return False
         return len(nameservers) > 0
     
@@ -387,31 +429,28 @@ class PorkbunDNS:
     
     # bulk_delete_records() method removed - unused code
     
-    def export_dns_records(self, domain: str, format: str = "json") -> str:
-        """Export DNS records in various formats
+    def export_dns_records_to(self, domain: str, format: str, fileobj) -> None:
+        """Export DNS records directly into a writable text file object
+        
+        Streams CSV rows and zone lines as they are built instead of
+        accumulating the whole document in memory first.
         
         Args:
             domain: Domain name
             format: Export format ('json', 'zone', 'csv')
-            
-        Returns:
-            Formatted DNS records
+            fileobj: Writable text file object
         """
         records = self.get_dns_records(domain)
         
         if format == "json":
-            return json.dumps(records, indent=2)
+            fileobj.write(dumps_json(records))
         elif format == "csv":
             import csv
-            import io
-            output = io.StringIO()
             if records:
-                writer = csv.DictWriter(output, fieldnames=records[0].keys())
+                writer = csv.DictWriter(fileobj, fieldnames=records[0].keys())
                 writer.writeheader()
                 writer.writerows(records)
-            return output.getvalue()
         elif format == "zone":
-            zone_lines = []
             for record in records:
                 name = record.get("name", "@")
                 ttl = record.get("ttl", 600)
@@ -420,9 +459,23 @@ class PorkbunDNS:
                 prio = record.get("prio", "")
                 
                 if record_type == "MX" and prio:
-                    zone_lines.append(f"{name}\t{ttl}\tIN\t{record_type}\t{prio} {content}")
+                    fileobj.write(f"{name}\t{ttl}\tIN\t{record_type}\t{prio} {content}\n")
                 else:
-                    zone_lines.append(f"{name}\t{ttl}\tIN\t{record_type}\t{content}")
-            return "\n".join(zone_lines)
+                    fileobj.write(f"{name}\t{ttl}\tIN\t{record_type}\t{content}\n")
         else:
-            raise ValueError(f"Unsupported format: {format}")
\ No newline at end of file
+            raise ValueError(f"Unsupported format: {format}")
+    
+    def export_dns_records(self, domain: str, format: str = "json") -> str:
+        """Export DNS records in various formats
+        
+        Args:
+            domain: Domain name
+            format: Export format ('json', 'zone', 'csv')
+            
+        Returns:
+            Formatted DNS records
+        """
+        import io
+        output = io.StringIO()
+        self.export_dns_records_to(domain, format, output)
+        return output.getvalue()
\ No newline at end of file
@@ -1,5 +1,5 @@
 """Profile management utilities for multi-account support."""
-import json
+import copy
 import os
 import re
 import uuid
@@ -7,14 +7,37 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+from PyQt6.QtCore import QSettings
+
+from lib.config_io import load_json, dump_json_atomic
+
+
+# The frequently-rewritten bits (active-profile pointer, last-used
+# timestamps) live in QSettings, whose cached and lazily-synced backend
+# avoids a full profiles.json rewrite on every profile switch/login
+_SETTINGS_ORG = "porkbun-dns-manager"
+_SETTINGS_APP = "profiles"
+
+# Config locations, resolved once at import (Path.home() hits the
+# environment/passwd database on every call)
+CONFIG_DIR = Path.home() / ".porkbun_dns"
+PROFILE_FILE = CONFIG_DIR / "profiles.json"
+LEGACY_CONFIG_FILE = CONFIG_DIR / "config.json"
+
+# Parsed profile store shared across ProfileManager instances, keyed by
+# the file's mtime so re-instantiation skips the reparse while picking up
+# external edits to the file
+_PROFILE_CACHE: Dict[str, Any] = {"mtime_ns": None, "data": None}
+
 
 class ProfileManager:
     """Handles CRUD operations for saved API profiles."""
 
     def __init__(self):
-        self.config_dir = Path.home() / ".porkbun_dns"
-        self.profile_file = self.config_dir / "profiles.json"
-        self.legacy_config_file = self.config_dir / "config.json"
+        self.config_dir = CONFIG_DIR
+        self.profile_file = PROFILE_FILE
+        self.legacy_config_file = LEGACY_CONFIG_FILE
+        self.settings = QSettings(_SETTINGS_ORG, _SETTINGS_APP)
         self.data: Dict[str, Any] = {
             "active_profile": None,
             "profiles": {}
@@ -28,10 +51,14 @@ class ProfileManager:
         """Load profiles from disk and migrate legacy settings if needed."""
         if self.profile_file.exists():
             try:
-                with open(self.profile_file, "r", encoding="utf-8") as f:
-                    loaded = json.load(f)
-                    if isinstance(loaded, dict):
-                        self.data.update(loaded)
+                mtime_ns = self.profile_file.stat().st_mtime_ns
+                if _PROFILE_CACHE["mtime_ns"] != mtime_ns:
+                    _PROFILE_CACHE["data"] = load_json(self.profile_file)
+                    _PROFILE_CACHE["mtime_ns"] = mtime_ns
+                loaded = _PROFILE_CACHE["data"]
+                if isinstance(loaded, dict):
+                    # Deep copy so instance mutations never alias the cache
+                    self.data.update(copy.deepcopy(loaded))
             except Exception:
                 # Fall back to clean structure on error
                 self.data = {
@@ -45,14 +72,16 @@ class ProfileManager:
         if not self.data["profiles"]:
             self._maybe_migrate_legacy()
 
-        # Ensure config dir exists and persist the structure so users can edit manually if needed
-        self.save()
+        # Create the store on first run so users can edit it manually;
+        # routine startups skip the redundant rewrite
+        if not self.profile_file.exists():
+            self.save()
 
     def save(self):
         """Persist profile data to disk."""
-        self.config_dir.mkdir(parents=True, exist_ok=True)
-        with open(self.profile_file, "w", encoding="utf-8") as f:
-            json.dump(self.data, f, indent=2, ensure_ascii=False)
+        # Mirror the QSettings pointer so the JSON stays hand-editable
+        self.data["active_profile"] = self.get_active_profile_id()
+        dump_json_atomic(self.profile_file, self.data)
 
     # ------------------------------------------------------------------\n+    # CRUD operations
     # ------------------------------------------------------------------
@@ -77,18 +106,21 @@ class ProfileManager:
         return self.data.get("profiles", {}).get(profile_id)
 
     def get_active_profile_id(self) -> Optional[str]:
-        active_id = self.data.get("active_profile")
+        active_id = self.settings.value("active_profile") or self.data.get("active_profile")
         if active_id in self.data.get("profiles", {}):
             return active_id
         return None
 
     def set_active_profile(self, profile_id: Optional[str]):
         if profile_id and profile_id in self.data.get("profiles", {}):
-            self.data["active_profile"] = profile_id
-            self.data["profiles"][profile_id]["last_used_at"] = datetime.now().isoformat()
+            timestamp = datetime.now().isoformat()
+            self.settings.setValue("active_profile", profile_id)
+            self.settings.setValue(f"last_used/{profile_id}", timestamp)
+            self.data["profiles"][profile_id]["last_used_at"] = timestamp
         else:
-            self.data["active_profile"] = None
-        self.save()
+            self.settings.setValue("active_profile", "")
+        # QSettings syncs lazily in the background; the JSON store is only
+        # rewritten when the profiles themselves change
 
     def add_profile(self, label: str, api_key: str, secret_api_key: str) -> str:
         profile_id = self._generate_profile_id(label)
@@ -102,8 +134,8 @@ class ProfileManager:
         }
 
         # First profile becomes active automatically
-        if not self.data.get("active_profile"):
-            self.data["active_profile"] = profile_id
+        if not self.get_active_profile_id():
+            self.set_active_profile(profile_id)
         self.save()
         return profile_id
 
@@ -123,8 +155,8 @@ class ProfileManager:
         if profile_id not in self.data.get("profiles", {}):
             return
         del self.data["profiles"][profile_id]
-        if self.data.get("active_profile") == profile_id:
-            self.data["active_profile"] = next(iter(self.data.get("profiles", {})), None)
+        if self.get_active_profile_id() is None:
+            self.set_active_profile(next(iter(self.data.get("profiles", {})), None))
         self.save()
 
     # ------------------------------------------------------------------
@@ -145,8 +177,7 @@ class ProfileManager:
         legacy_data = None
         if self.legacy_config_file.exists():
             try:
-                with open(self.legacy_config_file, "r", encoding="utf-8") as f:
-                    legacy_data = json.load(f)
+                legacy_data = load_json(self.legacy_config_file)
             except Exception:
                 legacy_data = None
 
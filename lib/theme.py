@@ -0,0 +1,176 @@
+"""Application-level stylesheet.
+
+모든 정적 QSS를 한 곳에 모아 QApplication에 한 번만 적용한다. 위젯
+생성 시마다 같은 CSS를 다시 파싱하지 않으며, objectName/클래스
+셀렉터로 스코프를 지정한다. 그룹 색상처럼 인스턴스마다 달라지는
+스타일만 위젯 쪽에 남아 있다 (lib/dashboard_widget.py의
+_group_style / _group_drag_style).
+"""
+
+APP_QSS = """
+/* ---- Dashboard root -------------------------------------------------- */
+DashboardWidget {
+    background: #f8f9fa;
+    font-family: 'Segoe UI', Arial, sans-serif;
+}
+
+/* ---- Dashboard toolbar ----------------------------------------------- */
+QPushButton#dashAddGroupBtn {
+    background: #007bff;
+    color: white;
+    border: none;
+    border-radius: 4px;
+    padding: 6px 12px;
+    font-size: 12px;
+    font-weight: 500;
+    font-family: 'Segoe UI', Arial, sans-serif;
+}
+QPushButton#dashAddGroupBtn:hover {
+    background: #0056b3;
+}
+
+QLabel#dashStatusLabel {
+    color: #6c757d;
+    font-size: 11px;
+    padding: 2px 6px;
+    font-family: 'Segoe UI', Arial, sans-serif;
+}
+
+QPushButton#dashSaveBtn {
+    background: #28a745;
+    color: white;
+    border: none;
+    border-radius: 4px;
+    padding: 6px 12px;
+    font-size: 12px;
+    font-weight: 500;
+    font-family: 'Segoe UI', Arial, sans-serif;
+}
+QPushButton#dashSaveBtn:hover {
+    background: #1e7e34;
+}
+
+/* ---- Ungrouped panel -------------------------------------------------- */
+QFrame#ungroupedFrame {
+    background: #ffffff;
+    border: 1px solid #dee2e6;
+    border-radius: 6px;
+    margin: 2px;
+}
+
+QLabel#ungroupedLabel {
+    font-weight: 600;
+    font-size: 12px;
+    color: #495057;
+    padding: 6px 8px;
+    background: #f8f9fa;
+    border-bottom: 1px solid #dee2e6;
+    font-family: 'Segoe UI', Arial, sans-serif;
+}
+
+/* ---- Groups scroll area ----------------------------------------------- */
+QScrollArea#groupsScroll {
+    background: #ffffff;
+    border: 1px solid #dee2e6;
+    border-radius: 6px;
+    margin: 2px;
+}
+QScrollArea#groupsScroll QScrollBar:horizontal {
+    border: none;
+    background: #f8f9fa;
+    height: 6px;
+}
+QScrollArea#groupsScroll QScrollBar::handle:horizontal {
+    background: #dee2e6;
+    border-radius: 3px;
+    min-width: 15px;
+}
+QScrollArea#groupsScroll QScrollBar::handle:horizontal:hover {
+    background: #adb5bd;
+}
+
+/* ---- DomainGroup header widgets --------------------------------------- */
+QLabel#groupNameLabel {
+    font-weight: 600;
+    font-size: 14px;
+    color: #212529;
+    padding: 2px 6px;
+    font-family: 'Segoe UI', Arial, sans-serif;
+}
+
+QLabel#groupCountLabel {
+    color: #6c757d;
+    font-size: 11px;
+    padding: 2px 8px;
+    border-radius: 10px;
+    background: #e9ecef;
+    font-family: 'Segoe UI', Arial, sans-serif;
+}
+
+QToolButton#groupCopyBtn {
+    background: #17a2b8;
+    color: white;
+    border: none;
+    border-radius: 3px;
+    padding: 2px 4px;
+    font-size: 11px;
+    font-weight: 500;
+    font-family: 'Segoe UI', Arial, sans-serif;
+}
+QToolButton#groupCopyBtn:hover {
+    background: #117a8b;
+}
+QToolButton#groupCopyBtn:disabled {
+    background: #cfe2f3;
+    color: #6c757d;
+}
+
+QToolButton#groupSettingsBtn {
+    border: none;
+    font-size: 12px;
+    background: transparent;
+    border-radius: 3px;
+    padding: 2px;
+    color: #6c757d;
+}
+QToolButton#groupSettingsBtn:hover {
+    background: #e9ecef;
+    color: #495057;
+}
+
+QLabel#groupDropHint {
+    color: #6c757d;
+    font-style: italic;
+    font-size: 12px;
+    padding: 12px;
+    background: transparent;
+    border: 1px dashed #dee2e6;
+    border-radius: 4px;
+    margin: 4px;
+    font-family: 'Segoe UI', Arial, sans-serif;
+}
+
+/* ---- Domain list views (both panels) ----------------------------------- */
+DomainListView {
+    border: none;
+    background: transparent;
+}
+DomainListView QScrollBar:vertical {
+    border: none;
+    background: #f8f9fa;
+    width: 4px;
+}
+DomainListView QScrollBar::handle:vertical {
+    background: #dee2e6;
+    border-radius: 2px;
+    min-height: 10px;
+}
+DomainListView QScrollBar::handle:vertical:hover {
+    background: #adb5bd;
+}
+"""
+
+
+def apply_app_styles(app) -> None:
+    """Install the shared stylesheet on the QApplication."""
+    app.setStyleSheet(APP_QSS)
@@ -1,39 +1,60 @@
-import json
 import time
 from pathlib import Path
 from typing import List, Dict, Optional
 from datetime import datetime
-from PyQt6.QtCore import QObject, pyqtSignal
+from PyQt6.QtCore import QThread, pyqtSignal
 import requests
 import logging
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
+from lib.config_io import load_json_cached, dump_json_atomic
+from lib.porkbun_dns import PORKBUN_NAMESERVER_SET
+
 logger = logging.getLogger(__name__)
 
-class DomainNSWorker(QObject):
+NS_CONFIG_FILE = Path("config/nameserver_config.json")
+
+class DomainNSWorker(QThread):
     progress_updated = pyqtSignal(int, int, str)  # current, total, message
     check_completed = pyqtSignal(list)  # external_ns_domains
     error_occurred = pyqtSignal(str)
     
+    # 마지막으로 읽거나 쓴 설정의 프로세스 내 사본. 체크 직후의
+    # 로그인 경로가 디스크를 다시 읽지 않게 한다.
+    _MEM_CACHE: Optional[Dict] = None
+    
     def __init__(self):
         super().__init__()
         self.api_key = None
         self.api_secret = None
-        self.config_file = Path("config/nameserver_config.json")
+        self.domains: List[str] = []
+        self.config_file = NS_CONFIG_FILE
         self.is_checking = False
         self.rate_limit_delay = 0.5  # 500ms delay between requests
         self.batch_size = 5  # Process 5 domains at a time
+        # One pooled session for every lookup: keep-alive connections are
+        # reused across domains instead of paying a TLS handshake each
+        self.session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=self.batch_size, pool_maxsize=self.batch_size
+        )
+        self.session.mount("https://", adapter)
         
     def set_credentials(self, api_key: str, api_secret: str):
         self.api_key = api_key
         self.api_secret = api_secret
     
-    def load_config(self) -> Dict:
+    @classmethod
+    def load_config(cls) -> Dict:
         """Load saved nameserver configuration"""
-        if self.config_file.exists():
+        if cls._MEM_CACHE is not None:
+            return cls._MEM_CACHE
+        if NS_CONFIG_FILE.exists():
             try:
-                with open(self.config_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
+                # load_json_cached는 mtime 키로 메모이즈되므로 체크 완료
+                # 직후와 로그인 시의 반복 호출이 파싱을 공유한다
+                cls._MEM_CACHE = load_json_cached(NS_CONFIG_FILE)
+                return cls._MEM_CACHE
             except Exception as e:
                 logger.error(f"Failed to load config: {e}")
         return {
@@ -45,12 +66,16 @@ class DomainNSWorker(QObject):
     def save_config(self, config: Dict):
         """Save nameserver configuration"""
         try:
-            self.config_file.parent.mkdir(exist_ok=True)
-            with open(self.config_file, 'w', encoding='utf-8') as f:
-                json.dump(config, f, indent=2, ensure_ascii=False)
+            dump_json_atomic(self.config_file, config)
+            DomainNSWorker._MEM_CACHE = config
         except Exception as e:
             logger.error(f"Failed to save config: {e}")
     
+    @classmethod
+    def reset_cache(cls):
+        """Drop the in-memory config copy (e.g. on logout)"""
+        cls._MEM_CACHE = None
+    
     def check_domain_ns(self, domain: str) -> Optional[Dict]:
         """Check nameserver for a single domain with retry logic"""
         url = f"https://api.porkbun.com/api/json/v3/domain/getNs/{domain}"
@@ -64,15 +89,13 @@ class DomainNSWorker(QObject):
         
         for attempt in range(max_retries):
             try:
-                response = requests.post(url, json=data, timeout=10)
+                response = self.session.post(url, json=data, timeout=10)
                 if response.status_code == 200:
                     result = response.json()
                     if result.get("status") == "SUCCESS":
                         ns_list = result.get("ns", [])
                         # Check if any NS is not Porkbun's
-                        porkbun_ns = ["curitiba.ns.porkbun.com", "fortaleza.ns.porkbun.com", 
-                                    "maceio.ns.porkbun.com", "salvador.ns.porkbun.com"]
-                        external_ns = [ns for ns in ns_list if ns not in porkbun_ns]
+                        external_ns = [ns for ns in ns_list if ns not in PORKBUN_NAMESERVER_SET]
                         
                         if external_ns:
                             return {
@@ -118,6 +141,9 @@ class DomainNSWorker(QObject):
         external_ns_domains = []
         total = len(domains)
         current = 0
+        # 도메인마다 큐드 시그널을 쏘면 GUI 이벤트 루프가 포화되므로
+        # 초당 최대 ~20회로 묶는다 (마지막 업데이트는 항상 전달)
+        last_emit = 0.0
         
         try:
             # Process domains with ThreadPoolExecutor for parallel checking
@@ -134,7 +160,10 @@ class DomainNSWorker(QObject):
                     for future in as_completed(futures):
                         domain = futures[future]
                         current += 1
-                        self.progress_updated.emit(current, total, f"Checking {domain}...")
+                        now = time.monotonic()
+                        if now - last_emit > 0.05 or current == total:
+                            self.progress_updated.emit(current, total, f"Checking {domain}...")
+                            last_emit = now
                         
                         try:
                             result = future.result(timeout=15)
@@ -175,18 +204,25 @@ class DomainNSWorker(QObject):
         finally:
             self.is_checking = False
     
+    def run(self):
+        """QThread entry point; does the network work off the GUI thread"""
+        self.check_all_domains(self.domains)
+    
     def start_check(self, domains: List[str]):
         """Start checking domains (called from main thread)"""
         if not self.api_key or not self.api_secret:
             self.error_occurred.emit("API credentials not set")
             return
+        if self.isRunning():
+            return
         
-        # Run synchronously
-        self.check_all_domains(domains)
+        self.domains = list(domains)
+        self.start()
     
-    def get_cached_external_domains(self) -> List[Dict]:
+    @staticmethod
+    def get_cached_external_domains() -> List[Dict]:
         """Get cached external nameserver domains"""
-        config = self.load_config()
+        config = DomainNSWorker.load_config()
         return config.get("external_ns_domains", [])
     
     # is_external_ns_domain() method removed - unused code
\ No newline at end of file
@@ -1,31 +1,111 @@
 """PyQt6 GUI for Porkbun DNS Manager"""
+import io
+import os
+import re
 import sys
-import json
-from pathlib import Path
+import time
+import webbrowser
 from datetime import datetime
+from functools import lru_cache
 from typing import Optional, List, Dict, Any, Callable
-# Removed unused ThreadPoolExecutor, as_completed imports
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-    QTableWidget, QTableWidgetItem, QPushButton, QComboBox, QLabel,
+    QPushButton, QComboBox, QLabel,
     QMessageBox, QDialog, QDialogButtonBox, QFormLayout, QLineEdit,
-    QSpinBox, QTextEdit, QFileDialog, QMenu, QHeaderView, QSplitter,
-    QGroupBox, QCheckBox, QToolBar, QStatusBar, QListWidget, QListWidgetItem,
-    QProgressDialog, QProgressBar, QTabWidget
+    QSpinBox, QTextEdit, QFileDialog, QMenu, QHeaderView,
+    QGroupBox, QToolBar, QStatusBar, QListWidget, QListWidgetItem,
+    QProgressDialog, QProgressBar, QTabWidget, QListView, QTableView,
+    QAbstractItemView
 )
-from PyQt6.QtCore import Qt, QThread, pyqtSignal, QTimer
-from PyQt6.QtGui import QAction, QIcon, QFont, QColor, QKeySequence, QShortcut
-import os
-from dotenv import load_dotenv
+from PyQt6.QtCore import (
+    Qt, QThread, pyqtSignal, QTimer, QThreadPool, QAbstractListModel,
+    QAbstractTableModel, QModelIndex, QObject, QRunnable, QSignalBlocker
+)
+from PyQt6.QtGui import QAction, QFont, QColor, QKeySequence, QShortcut
 from lib.porkbun_dns import PorkbunDNS, RecordType
-from lib.dashboard_widget import DashboardWidget
 from lib.dns_templates import get_template, TemplateResult
 from lib.workers.bulk_dns_worker import BulkDNSWorker
-from lib.workers.domain_ns_worker import DomainNSWorker
 from lib.profile_manager import ProfileManager
 
+# DashboardWidget, DomainNSWorker and dotenv are imported lazily at first
+# use so importing this module stays cheap
+
+
+# Record types never change at runtime; fold the enum walk done on every
+# dialog construction into one tuple at import
+RECORD_TYPE_VALUES = tuple(rt.value for rt in RecordType)
+
+# Shared per-item colors for the API-access list (QColor is app-free and
+# safe to build at import; fonts are cached lazily below)
+_COLOR_OK = QColor(0, 128, 0)
+_COLOR_BAD = QColor(200, 0, 0)
+
+# Row-text templates for the API-access list, interpolated with % in the
+# result loop instead of rebuilding the f-string literals per domain
+_TPL_OK = "✅ %s - API 접근 활성화됨"
+_TPL_BAD = "❌ %s - API 접근 비활성화 (활성화 필요!)"
+_TPL_INACTIVE = "⚫ %s - 비활성 도메인"
+
+
+@lru_cache(maxsize=1)
+def _summary_font() -> QFont:
+    """Bold 10pt summary font, built once after QApplication exists."""
+    font = QFont()
+    font.setPointSize(10)
+    font.setBold(True)
+    return font
 
-load_dotenv()
+
+@lru_cache(maxsize=1)
+def _record_type_font() -> QFont:
+    """Bold 9pt font for the records-table type column."""
+    font = QFont()
+    font.setPointSize(9)
+    font.setBold(True)
+    return font
+
+
+# Foreground color per record type in the records table
+_TYPE_COLOR = {
+    "A": QColor(0, 128, 0),
+    "AAAA": QColor(0, 100, 0),
+    "CNAME": QColor(0, 0, 200),
+    "MX": QColor(200, 0, 0),
+    "TXT": QColor(128, 0, 128),
+}
+
+# Background for cells with unsaved edits (light yellow)
+_MODIFIED_BG = QColor(255, 255, 200)
+
+# Save-button style while edits are pending (built once, not per edit)
+_SAVE_DIRTY_QSS = "QPushButton { background-color: #4CAF50; color: white; font-weight: bold; }"
+
+# 내보내기 파일 확장자 → 포맷 (그 외 확장자는 json)
+_EXT_TO_FMT = {".csv": "csv", ".zone": "zone"}
+
+
+# Record types whose dialogs expose a priority field
+_PRIORITY_TYPES = frozenset({"MX", "SRV"})
+
+# Known DNS providers as (hostname substring, label) pairs, matched in one
+# pass over the lowercased nameserver list
+NS_PROVIDERS = (
+    ("cloudflare", "Cloudflare"),
+    ("google", "Google Cloud DNS"),
+    ("ns-cloud", "Google Cloud DNS"),
+    ("awsdns", "AWS Route53"),
+    ("hostinger", "Hostinger"),
+    ("namecheap", "Namecheap"),
+)
+
+# All provider substrings compiled into one alternation so detection is a
+# single scan regardless of how many providers the table grows
+_NS_PROVIDER_RE = re.compile("|".join(re.escape(sub) for sub, _ in NS_PROVIDERS))
+_NS_PROVIDER_LABELS = dict(NS_PROVIDERS)
+
+# 콤보 항목 텍스트에 붙는 NS 상태 표시를 한 번에 벗겨내는 패턴
+_INDICATOR_RE = re.compile(r"^(?:🐷 |⚠️ )|(?: \(외부 NS\))$")
 
 
 # ApiWorker class removed - unused (replaced by specialized workers)
@@ -36,6 +116,7 @@ class LoginWorker(QThread):
     success = pyqtSignal(object, list)  # PorkbunDNS 객체와 도메인 리스트 전달
     error = pyqtSignal(str)
     status = pyqtSignal(str)  # 상태 메시지
+    nameservers_ready = pyqtSignal(dict)  # {domain: [nameservers]} 프리페치 결과
     
     def __init__(self, api_key: str, secret_key: str):
         super().__init__()
@@ -44,17 +125,26 @@ class LoginWorker(QThread):
     
     def run(self):
         try:
+            if self.isInterruptionRequested():
+                return
             self.status.emit("API 연결 시도 중...")
             client = PorkbunDNS(self.api_key, self.secret_key)
             
             self.status.emit("API 인증 확인 중...")
             if client.ping():
+                if self.isInterruptionRequested():
+                    return
                 self.status.emit("도메인 목록 가져오는 중...")
                 # 도메인 목록도 백그라운드에서 로드
                 try:
                     domains = client.get_domains()
+                    if self.isInterruptionRequested():
+                        return
                     self.status.emit("로그인 성공!")
                     self.success.emit(client, domains)
+                    # UI는 이미 로그인 완료; 같은 워커에서 네임서버를
+                    # 병렬로 미리 받아 두면 다이얼로그가 즉시 뜬다
+                    self._prefetch_nameservers(client, domains)
                 except Exception as e:
                     self.status.emit("로그인 성공!")
                     self.success.emit(client, [])  # 도메인 로드 실패해도 로그인은 성공
@@ -63,6 +153,115 @@ class LoginWorker(QThread):
         except Exception as e:
             self.error.emit(f"연결 실패: {str(e)}")
 
+    def _prefetch_nameservers(self, client: PorkbunDNS, domains: List[Dict[str, Any]]):
+        """Fetch nameservers for all active domains in parallel"""
+        if self.isInterruptionRequested():
+            return
+        names = [
+            d.get("domain", "") for d in domains
+            if d.get("domain") and d.get("status") == "ACTIVE"
+        ]
+        if not names:
+            return
+        ns_map = {}
+        try:
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                futures = {
+                    executor.submit(client.get_nameservers, name): name
+                    for name in names
+                }
+                for future in as_completed(futures):
+                    if self.isInterruptionRequested():
+                        return
+                    try:
+                        ns_map[futures[future]] = future.result()
+                    except Exception:
+                        continue  # 실패한 도메인은 다이얼로그에서 직접 조회
+        except Exception:
+            return
+        if ns_map:
+            self.nameservers_ready.emit(ns_map)
+
+
+class DomainsFetchWorker(QThread):
+    """Background worker for refreshing the domain list"""
+    success = pyqtSignal(list)
+    error = pyqtSignal(str)
+
+    def __init__(self, client: PorkbunDNS):
+        super().__init__()
+        self.client = client
+
+    def run(self):
+        try:
+            self.success.emit(self.client.get_domains())
+        except Exception as e:
+            self.error.emit(str(e))
+
+
+class _RecordMutationSignals(QObject):
+    """QRunnable은 시그널을 못 가지므로 QObject 브리지를 쓴다"""
+    finished = pyqtSignal(list)  # [(label, result|None, error|None), ...]
+
+
+class RecordMutationWorker(QRunnable):
+    """Apply DNS record mutations on the shared thread pool.
+
+    mutations is a list of (label, method_name, kwargs) tuples; each is
+    dispatched to the matching PorkbunDNS method. Several mutations run
+    in parallel so a bulk save costs roughly one round-trip instead of
+    one per record.
+    """
+
+    def __init__(self, client: PorkbunDNS, mutations: list):
+        super().__init__()
+        self.client = client
+        self.mutations = mutations
+        self.signals = _RecordMutationSignals()
+
+    def run(self):
+        def apply_one(mutation):
+            label, method_name, kwargs = mutation
+            try:
+                return label, getattr(self.client, method_name)(**kwargs), None
+            except Exception as e:
+                return label, None, str(e)
+
+        if len(self.mutations) <= 1:
+            results = [apply_one(m) for m in self.mutations]
+        else:
+            with ThreadPoolExecutor(max_workers=min(8, len(self.mutations))) as executor:
+                results = list(executor.map(apply_one, self.mutations))
+        self.signals.finished.emit(results)
+
+
+class _ExportSignals(QObject):
+    finished = pyqtSignal(str)  # 완료된 파일 경로
+    error = pyqtSignal(str)
+
+
+class ExportTask(QRunnable):
+    """Serialize and write a zone export off the GUI thread"""
+
+    def __init__(self, client: PorkbunDNS, domain: str, export_format: str, file_path: str):
+        super().__init__()
+        self.client = client
+        self.domain = domain
+        self.export_format = export_format
+        self.file_path = file_path
+        self.signals = _ExportSignals()
+
+    def run(self):
+        try:
+            with open(
+                self.file_path, "w", buffering=1 << 20, encoding="utf-8", newline=""
+            ) as f:
+                self.client.export_dns_records_to(self.domain, self.export_format, f)
+        except Exception as e:
+            self.signals.error.emit(str(e))
+        else:
+            self.signals.finished.emit(self.file_path)
+
 
 class ProfileEditorDialog(QDialog):
     """Dialog for creating or editing a profile."""
@@ -323,7 +522,7 @@ class RecordDialog(QDialog):
         
         # Record type
         self.type_combo = QComboBox()
-        self.type_combo.addItems([rt.value for rt in RecordType])
+        self.type_combo.addItems(list(RECORD_TYPE_VALUES))
         if record:
             self.type_combo.setCurrentText(record.get("type", "A"))
             self.type_combo.setEnabled(False)  # Can't change type when editing
@@ -384,12 +583,17 @@ class RecordDialog(QDialog):
         self.setLayout(layout)
         
         # Update priority visibility
+        self._priority_visible = None
         self.on_type_changed(self.type_combo.currentText())
     
     def on_type_changed(self, record_type: str):
         """Handle record type change"""
-        # Show/hide priority field based on record type
-        show_priority = record_type in ["MX", "SRV"]
+        # Show/hide priority field; skip the relayout when the visibility
+        # state is already what the new type wants
+        show_priority = record_type in _PRIORITY_TYPES
+        if show_priority == self._priority_visible:
+            return
+        self._priority_visible = show_priority
         self.priority_label.setVisible(show_priority)
         self.priority_input.setVisible(show_priority)
     
@@ -414,10 +618,13 @@ class RecordDialog(QDialog):
 
 class NameserverDialog(QDialog):
     """Dialog to manage nameservers for a domain"""
-    def __init__(self, client: PorkbunDNS, domain: str, parent=None):
+    def __init__(self, client: PorkbunDNS, domain: str, parent=None,
+                 cached_nameservers: Optional[List[str]] = None):
         super().__init__(parent)
         self.client = client
         self.domain = domain
+        # 로그인 시 프리페치된 네임서버; 첫 표시에서만 쓰고 버린다
+        self.cached_nameservers = cached_nameservers
         self.setWindowTitle(f"네임서버 관리 - {domain}")
         self.setModal(True)
         self.setMinimumWidth(500)
@@ -487,7 +694,11 @@ class NameserverDialog(QDialog):
     def load_current_nameservers(self):
         """Load current nameservers for the domain"""
         try:
-            nameservers = self.client.get_nameservers(self.domain)
+            if self.cached_nameservers is not None:
+                nameservers = self.cached_nameservers
+                self.cached_nameservers = None
+            else:
+                nameservers = self.client.get_nameservers(self.domain)
             
             # Clear inputs
             for input in self.ns_inputs:
@@ -509,18 +720,8 @@ class NameserverDialog(QDialog):
                 self.porkbun_btn.setText("🐷 이미 Porkbun 네임서버 사용 중")
             else:
                 # Show which service might be in use
-                if any("cloudflare" in ns.lower() for ns in nameservers):
-                    service = "Cloudflare"
-                elif any("google" in ns.lower() or "ns-cloud" in ns.lower() for ns in nameservers):
-                    service = "Google Cloud DNS"
-                elif any("awsdns" in ns.lower() for ns in nameservers):
-                    service = "AWS Route53"
-                elif any("hostinger" in ns.lower() for ns in nameservers):
-                    service = "Hostinger"
-                elif any("namecheap" in ns.lower() for ns in nameservers):
-                    service = "Namecheap"
-                else:
-                    service = "외부"
+                match = _NS_PROVIDER_RE.search(" ".join(nameservers).lower())
+                service = _NS_PROVIDER_LABELS[match.group(0)] if match else "외부"
                 
                 self.status_label.setText(
                     f"⚠️ {service} 네임서버를 사용 중입니다.\n"
@@ -608,12 +809,221 @@ class NameserverDialog(QDialog):
                 if msg_box.clickedButton() == porkbun_btn:
                     self.set_porkbun_nameservers()
                 elif msg_box.clickedButton() == web_btn:
-                    import webbrowser
                     webbrowser.open(f"https://porkbun.com/account/domainsSpeedy?domain={self.domain}")
             else:
                 QMessageBox.critical(self, "오류", f"네임서버 업데이트 오류:\n\n{error_msg}")
 
 
+class DomainStatusModel(QAbstractListModel):
+    """Plain-data rows for the API-access status list.
+
+    QListWidget pays for one item object plus a view invalidation per
+    addItem; this model owns (text, color, bold) tuples instead so
+    appending a row is O(1) and hundreds of domains stay cheap.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows: List[tuple] = []  # (text, QColor or None, bold)
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+        return len(self._rows)
+
+    def data(self, index: QModelIndex, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or not (0 <= index.row() < len(self._rows)):
+            return None
+        text, color, bold = self._rows[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return text
+        if role == Qt.ItemDataRole.ForegroundRole:
+            return color
+        if role == Qt.ItemDataRole.FontRole and bold:
+            return _summary_font()
+        return None
+
+    def clear(self):
+        self.beginResetModel()
+        self._rows = []
+        self.endResetModel()
+
+    def add_row(self, text: str, color: Optional[QColor] = None, bold: bool = False):
+        position = len(self._rows)
+        self.beginInsertRows(QModelIndex(), position, position)
+        self._rows.append((text, color, bold))
+        self.endInsertRows()
+
+
+class DNSRecordsModel(QAbstractTableModel):
+    """Table model serving the DNS records view straight from record dicts.
+
+    The view renders only visible rows from the shared current_records
+    list, so a reload is a single model reset instead of 7xN
+    QTableWidgetItem allocations, and edits arrive through setData
+    without the itemChanged disconnect/reconnect dance.
+    """
+
+    HEADERS = ("ID", "이름", "타입", "값", "TTL", "우선순위", "메모")
+    FIELDS = ("id", "name", "type", "content", "ttl", "prio", "notes")
+    # 항상 편집 가능한 열 / 어떤 경우에도 편집 불가인 필드 — flags와
+    # setData가 매 호출마다 리터럴을 새로 만들지 않도록 클래스 상수로 둔다
+    _EDITABLE_COLS = frozenset((1, 3, 4, 6))
+    _READONLY_FIELDS = frozenset(("id", "type"))
+
+    record_edited = pyqtSignal(str, str, object)  # record_id, field, value
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._records: List[Dict[str, Any]] = []
+        self._domain = ""
+        self._modified_cells = set()  # (row, column) with unsaved edits
+
+    # --- Qt model interface -------------------------------------------
+    def rowCount(self, parent=QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+        return len(self._records)
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+        return len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return self.HEADERS[section]
+        return None
+
+    def data(self, index: QModelIndex, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or not (0 <= index.row() < len(self._records)):
+            return None
+        record = self._records[index.row()]
+        column = index.column()
+        
+        if role in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole):
+            if column == 1:
+                name = record.get("name", "@")
+                return "@" if name == self._domain else name
+            value = record.get(self.FIELDS[column], "")
+            return "" if value is None else str(value)
+        if role == Qt.ItemDataRole.ForegroundRole and column == 2:
+            return _TYPE_COLOR.get(record.get("type", ""))
+        if role == Qt.ItemDataRole.FontRole and column == 2:
+            return _record_type_font()
+        if role == Qt.ItemDataRole.BackgroundRole:
+            if (index.row(), column) in self._modified_cells:
+                return _MODIFIED_BG
+        return None
+
+    def flags(self, index: QModelIndex):
+        if not index.isValid():
+            return Qt.ItemFlag.NoItemFlags
+        base = Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
+        column = index.column()
+        if column in self._EDITABLE_COLS:
+            return base | Qt.ItemFlag.ItemIsEditable
+        if column == 5 and self._records[index.row()].get("type") in _PRIORITY_TYPES:
+            return base | Qt.ItemFlag.ItemIsEditable
+        return base
+
+    def setData(self, index: QModelIndex, value, role=Qt.ItemDataRole.EditRole) -> bool:
+        if role != Qt.ItemDataRole.EditRole or not index.isValid():
+            return False
+        column = index.column()
+        field = self.FIELDS[column]
+        if field in self._READONLY_FIELDS:
+            return False
+        
+        value = "" if value is None else str(value)
+        
+        # Normalize TTL/priority the same way the old table handler did;
+        # isdigit()으로 정상 입력은 예외 기계 없이 바로 변환한다
+        if field == "ttl":
+            value = int(value) if value.isdigit() else 600
+        elif field == "prio" and value:
+            value = int(value) if value.isdigit() else ""
+        
+        record = self._records[index.row()]
+        record[field] = value
+        self._modified_cells.add((index.row(), column))
+        self.dataChanged.emit(index, index)
+        self.record_edited.emit(str(record.get("id", "")), field, value)
+        return True
+
+    # --- Convenience helpers ------------------------------------------
+    def set_records(self, records: List[Dict[str, Any]], domain: str):
+        """Replace the backing records in a single model reset."""
+        self.beginResetModel()
+        self._records = records
+        self._domain = domain
+        self._modified_cells = set()
+        self.endResetModel()
+
+    def clear(self):
+        self.set_records([], "")
+
+    def append_record(self, record: Dict[str, Any]):
+        """Insert one record without resetting the whole model."""
+        row = len(self._records)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._records.append(record)
+        self.endInsertRows()
+
+    def refresh_row(self, row: int):
+        """Repaint one row after its backing dict changed in place."""
+        if not 0 <= row < len(self._records):
+            return
+        self._modified_cells = {c for c in self._modified_cells if c[0] != row}
+        self.dataChanged.emit(
+            self.index(row, 0), self.index(row, self.columnCount() - 1)
+        )
+
+    def clear_modified_marks(self):
+        """Drop the unsaved-edit highlight after a successful save."""
+        if not self._modified_cells:
+            return
+        rows = {row for row, _ in self._modified_cells}
+        self._modified_cells = set()
+        for row in rows:
+            self.dataChanged.emit(
+                self.index(row, 0), self.index(row, self.columnCount() - 1)
+            )
+
+    def remove_records_by_id(self, record_ids):
+        """Remove the rows for the given ids with targeted row removal."""
+        id_set = {str(record_id) for record_id in record_ids}
+        rows = [
+            row for row, record in enumerate(self._records)
+            if str(record.get("id", "")) in id_set
+        ]
+        for row in reversed(rows):
+            self.beginRemoveRows(QModelIndex(), row, row)
+            del self._records[row]
+            self.endRemoveRows()
+        if rows:
+            self._modified_cells = {
+                cell for cell in self._modified_cells if cell[0] not in set(rows)
+            }
+
+    def clear_modified_marks_for(self, record_ids):
+        """Drop the highlight only for the given record ids (partial save)."""
+        id_set = {str(record_id) for record_id in record_ids}
+        rows = {
+            row for row, record in enumerate(self._records)
+            if str(record.get("id", "")) in id_set
+        }
+        if not rows:
+            return
+        self._modified_cells = {
+            cell for cell in self._modified_cells if cell[0] not in rows
+        }
+        for row in rows:
+            self.dataChanged.emit(
+                self.index(row, 0), self.index(row, self.columnCount() - 1)
+            )
+
+
 class APIAccessDialog(QDialog):
     """Dialog to show API access status for all domains"""
     def __init__(self, client: PorkbunDNS, parent=None):
@@ -635,7 +1045,11 @@ class APIAccessDialog(QDialog):
         layout.addWidget(info_label)
         
         # Domain list
-        self.domain_list = QListWidget()
+        self.status_model = DomainStatusModel(self)
+        self.domain_list = QListView()
+        self.domain_list.setModel(self.status_model)
+        self.domain_list.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.domain_list.setUniformItemSizes(True)
         layout.addWidget(self.domain_list)
         
         # Instructions
@@ -677,18 +1091,16 @@ class APIAccessDialog(QDialog):
     
     def check_all_domains(self):
         """Check API access for all domains"""
-        self.domain_list.clear()
+        self.status_model.clear()
         self.check_button.setEnabled(False)
         
         try:
-            domains = self.client.get_domains()
-            
-            # Create progress dialog
+            # Indeterminate until the paginated domain list has streamed in
             progress = QProgressDialog(
                 "도메인 API 접근 상태 확인 중...",
                 "취소",
                 0,
-                len(domains),
+                0,
                 self
             )
             progress.setWindowTitle("확인 중")
@@ -698,51 +1110,63 @@ class APIAccessDialog(QDialog):
             enabled_count = 0
             disabled_count = 0
             
-            for i, domain in enumerate(domains):
-                if progress.wasCanceled():
-                    break
-                    
-                domain_name = domain.get("domain", "")
-                progress.setLabelText(f"{domain_name} 확인 중...")
-                progress.setValue(i)
-                
-                # Check if domain is active
-                if domain.get("status") != "ACTIVE":
-                    item = QListWidgetItem(f"⚫ {domain_name} - 비활성 도메인")
-                    self.domain_list.addItem(item)
-                    continue
-                
-                # Check API access
-                has_access = self.client.check_domain_api_access(domain_name)
-                
-                if has_access:
-                    item = QListWidgetItem(f"✅ {domain_name} - API 접근 활성화됨")
-                    item.setForeground(QColor(0, 128, 0))
-                    enabled_count += 1
-                else:
-                    item = QListWidgetItem(f"❌ {domain_name} - API 접근 비활성화 (활성화 필요!)")
-                    item.setForeground(QColor(200, 0, 0))
-                    disabled_count += 1
+            # Fan the independent HTTPS probes out on a pool and consume
+            # as they finish; widgets are only touched on the GUI thread
+            done_count = 0
+            total_domains = 0
+            with ThreadPoolExecutor(max_workers=16) as executor:
+                futures = {}
+                # Probes for the first page start while later pages of the
+                # domain list are still downloading; inactive domains need
+                # no network probe and are listed up front
+                for page in self.client.iter_domains():
+                    total_domains += len(page)
+                    for domain in page:
+                        domain_name = domain.get("domain", "")
+                        if domain.get("status") != "ACTIVE":
+                            self.status_model.add_row(_TPL_INACTIVE % domain_name)
+                        else:
+                            future = executor.submit(
+                                self.client.check_domain_api_access, domain_name
+                            )
+                            futures[future] = domain_name
                 
-                self.domain_list.addItem(item)
+                progress.setMaximum(len(futures))
+                for future in as_completed(futures):
+                    if progress.wasCanceled():
+                        for pending in futures:
+                            pending.cancel()
+                        break
+                    
+                    domain_name = futures[future]
+                    done_count += 1
+                    progress.setLabelText(f"{domain_name} 확인 완료")
+                    progress.setValue(done_count)
+                    
+                    try:
+                        has_access = future.result()
+                    except Exception:
+                        has_access = False
+                    
+                    if has_access:
+                        self.status_model.add_row(_TPL_OK % domain_name, _COLOR_OK)
+                        enabled_count += 1
+                    else:
+                        self.status_model.add_row(_TPL_BAD % domain_name, _COLOR_BAD)
+                        disabled_count += 1
             
-            progress.setValue(len(domains))
+            progress.setValue(progress.maximum())
             progress.close()
             
             # Show summary
-            summary = f"\n총 {len(domains)}개 도메인 중:\n"
+            summary = f"\n총 {total_domains}개 도메인 중:\n"
             summary += f"✅ 활성화: {enabled_count}개\n"
             summary += f"❌ 비활성화: {disabled_count}개"
             
             if disabled_count > 0:
                 summary += f"\n\n{disabled_count}개 도메인의 API ACCESS를 활성화해주세요."
             
-            summary_item = QListWidgetItem(summary)
-            bold_font = QFont()
-            bold_font.setPointSize(10)
-            bold_font.setBold(True)
-            summary_item.setFont(bold_font)
-            self.domain_list.addItem(summary_item)
+            self.status_model.add_row(summary, bold=True)
             
         except Exception as e:
             QMessageBox.critical(self, "오류", f"도메인 확인 실패: {str(e)}")
@@ -762,9 +1186,22 @@ class DNSManagerGUI(QMainWindow):
         self.current_domain = None
         self.current_records = []
         self.modified_records = {}  # Track modified records
+        self._mutation_worker = None  # 실행 중인 레코드 변경 워커 참조
+        self._inflight_mutations = set()  # 진행 중인 작업 시그니처 (중복 제출 방지)
+        self._pending_record_data = None  # 진행 중인 추가/수정의 폼 데이터
+        self._pending_edit_row = -1
+        # 연속 셀 편집의 버튼/상태바 갱신을 한 번으로 묶는 타이머
+        self._ui_flush_timer = QTimer(self)
+        self._ui_flush_timer.setSingleShot(True)
+        self._ui_flush_timer.timeout.connect(self._flush_modification_ui)
+        self._export_dialog = None  # 내보내기 다이얼로그 (첫 사용 시 생성 후 재사용)
         self.domain_info = {}  # Store domain nameserver info
         self.is_logged_in = False
         self.login_worker = None  # 로그인 쓰레드
+        # 교체 시점에 아직 돌고 있던 이전 로그인 쓰레드 보관소. 참조를
+        # 놓으면 "QThread: Destroyed while thread is still running"으로
+        # 즉사하므로 finished가 올 때까지 붙들어 둔다.
+        self._retired_login_workers: List[QThread] = []
         self.dashboard_widget = None  # 대시보드 위젯
         self.ns_check_worker = None  # 네임서버 체크 워커
         self.ns_progress_dialog = None  # 진행 표시 대화상자
@@ -772,11 +1209,27 @@ class DNSManagerGUI(QMainWindow):
         self.bulk_job_label = ""
         self.toast_label = None
         self.active_domains: List[str] = []
+        self.ns_cache: Dict[str, List[str]] = {}  # 로그인 시 프리페치한 네임서버
+        # 도메인별 레코드 캐시 {domain: (monotonic timestamp, records)} —
+        # 도메인을 오가는 반복 방문이 짧은 TTL 안에서는 재조회를 건너뛴다
+        self._record_cache: Dict[str, tuple] = {}
+        self._domain_index: Dict[str, int] = {}  # 도메인 → 콤보 인덱스
+        self._combo_dirty: set = set()  # NS 상태가 바뀌어 다시 칠할 도메인
+        # 콤보 재구성/빠른 스크롤 중의 중간 선택은 버리고 마지막
+        # 선택만 레코드 로드로 이어지게 하는 디바운스
+        self._pending_domain_text = ""
+        self._domain_change_timer = QTimer(self)
+        self._domain_change_timer.setSingleShot(True)
+        self._domain_change_timer.setInterval(150)
+        self._domain_change_timer.timeout.connect(self._commit_domain_change)
         self.bulk_tab_index = None
         self.default_tempererror_final = "v=spf1 include:_spf.AUTUMNWINDZ.COM ~all"
         self.init_ui()
         self.setup_shortcuts()
-        # GUI를 먼저 표시하고 로그인은 사용자가 버튼을 누를 때 수행
+        # 저장된 프로필이 있으면 로그인을 이벤트 루프 시작 직후로 예약해
+        # 네트워크 왕복이 첫 화면 구성과 겹치도록 한다
+        if self.selected_profile_id or self.profile_manager.get_active_profile_id():
+            QTimer.singleShot(0, self._auto_login)
     
     def init_ui(self):
         """Initialize the user interface"""
@@ -876,6 +1329,8 @@ class DNSManagerGUI(QMainWindow):
         self.tab_widget = QTabWidget()
         
         # Dashboard tab
+        from lib.dashboard_widget import DashboardWidget
+        
         self.dashboard_widget = DashboardWidget()
         self.dashboard_widget.domain_selected.connect(self.on_dashboard_domain_selected)
         self.tab_widget.addTab(self.dashboard_widget, "대시보드")
@@ -970,18 +1425,17 @@ class DNSManagerGUI(QMainWindow):
         domain_layout.addStretch()
         dns_control_layout.addLayout(domain_layout)
         
-        # Records table
-        self.records_table = QTableWidget()
-        self.records_table.setColumnCount(7)
-        self.records_table.setHorizontalHeaderLabels(["ID", "이름", "타입", "값", "TTL", "우선순위", "메모"])
+        # Records table (model/view: the model serves current_records
+        # directly and edits land in setData)
+        self.records_model = DNSRecordsModel(self)
+        self.records_model.record_edited.connect(self.on_record_edited)
+        self.records_table = QTableView()
+        self.records_table.setModel(self.records_model)
         self.records_table.horizontalHeader().setStretchLastSection(True)
-        self.records_table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
+        self.records_table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
         self.records_table.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
         self.records_table.customContextMenuRequested.connect(self.show_context_menu)
         
-        # Enable editing
-        self.records_table.itemChanged.connect(self.on_item_changed)
-        
         # Hide ID column
         self.records_table.setColumnHidden(0, True)
         
@@ -1183,7 +1637,7 @@ class DNSManagerGUI(QMainWindow):
         form_layout = QFormLayout()
 
         self.bulk_record_type_combo = QComboBox()
-        self.bulk_record_type_combo.addItems([rt.value for rt in RecordType])
+        self.bulk_record_type_combo.addItems(list(RECORD_TYPE_VALUES))
         self.bulk_record_type_combo.currentTextChanged.connect(self.on_bulk_record_type_changed)
         form_layout.addRow("레코드 타입:", self.bulk_record_type_combo)
 
@@ -1276,26 +1730,34 @@ class DNSManagerGUI(QMainWindow):
         refresh_shortcut = QShortcut(QKeySequence("F5"), self)
         refresh_shortcut.activated.connect(self.refresh_current_domain)
     
+    def _shared_actions(self) -> Dict[str, QAction]:
+        """Build the QActions shared by the menu bar and the toolbar once."""
+        if not hasattr(self, "_actions"):
+            actions = {
+                "settings": QAction("⚙️ 설정", self),
+                "api_status": QAction("🔍 API 상태", self),
+                "export": QAction("📥 내보내기", self),
+            }
+            actions["settings"].triggered.connect(self.show_settings)
+            actions["api_status"].triggered.connect(self.show_api_status)
+            actions["export"].triggered.connect(self.export_records)
+            self._actions = actions
+        return self._actions
+    
     def create_menu_bar(self):
         """Create menu bar"""
         menubar = self.menuBar()
+        actions = self._shared_actions()
         
         # File menu
         file_menu = menubar.addMenu("파일")
         
-        settings_action = QAction("설정", self)
-        settings_action.triggered.connect(self.show_settings)
-        file_menu.addAction(settings_action)
-        
-        api_status_action = QAction("API 접근 상태", self)
-        api_status_action.triggered.connect(self.show_api_status)
-        file_menu.addAction(api_status_action)
+        file_menu.addAction(actions["settings"])
+        file_menu.addAction(actions["api_status"])
         
         file_menu.addSeparator()
         
-        export_action = QAction("레코드 내보내기", self)
-        export_action.triggered.connect(self.export_records)
-        file_menu.addAction(export_action)
+        file_menu.addAction(actions["export"])
         
         file_menu.addSeparator()
         
@@ -1329,14 +1791,10 @@ class DNSManagerGUI(QMainWindow):
         """Create toolbar"""
         toolbar = QToolBar()
         self.addToolBar(toolbar)
+        actions = self._shared_actions()
         
-        settings_action = QAction("⚙️ 설정", self)
-        settings_action.triggered.connect(self.show_settings)
-        toolbar.addAction(settings_action)
-        
-        api_status_action = QAction("🔍 API 상태", self)
-        api_status_action.triggered.connect(self.show_api_status)
-        toolbar.addAction(api_status_action)
+        toolbar.addAction(actions["settings"])
+        toolbar.addAction(actions["api_status"])
         
         toolbar.addSeparator()
         
@@ -1349,33 +1807,25 @@ class DNSManagerGUI(QMainWindow):
         toolbar.addSeparator()
         
         refresh_action = QAction("🔄 새로고침", self)
-        refresh_action.triggered.connect(self.load_records)
+        refresh_action.triggered.connect(self.refresh_current_domain)
         toolbar.addAction(refresh_action)
         
-        export_action = QAction("📥 내보내기", self)
-        export_action.triggered.connect(self.export_records)
-        toolbar.addAction(export_action)
+        toolbar.addAction(actions["export"])
     
     def on_dashboard_domain_selected(self, domain: str):
         """Handle domain selection from dashboard"""
         # Switch to DNS control tab
         self.tab_widget.setCurrentIndex(1)  # DNS 컨트롤 탭
         
-        # Select domain in combo box
-        for i in range(self.domain_combo.count()):
-            item_data = self.domain_combo.itemData(i)
-            if item_data == domain:
-                self.domain_combo.setCurrentIndex(i)
-                break
-            # Also check text without indicators
-            item_text = self.domain_combo.itemText(i)
-            if domain in item_text:
-                self.domain_combo.setCurrentIndex(i)
-                break
+        # Select domain in combo box (O(1) via the index built in
+        # process_domains; also avoids the old substring mismatches)
+        index = self._domain_index.get(domain)
+        if index is not None:
+            self.domain_combo.setCurrentIndex(index)
     
     def show_context_menu(self, position):
         """Show context menu for records table"""
-        if not self.records_table.selectedItems():
+        if not self.records_table.selectionModel().hasSelection():
             return
         
         menu = QMenu()
@@ -1398,9 +1848,9 @@ class DNSManagerGUI(QMainWindow):
     
     def copy_content(self):
         """Copy selected record content to clipboard"""
-        current_row = self.records_table.currentRow()
-        if current_row >= 0:
-            content = self.records_table.item(current_row, 3).text()
+        current_row = self.records_table.currentIndex().row()
+        if 0 <= current_row < len(self.current_records):
+            content = str(self.current_records[current_row].get("content", ""))
             QApplication.clipboard().setText(content)
             self.status_bar.showMessage(f"복사됨: {content}", 2000)
 
@@ -1543,6 +1993,8 @@ class DNSManagerGUI(QMainWindow):
         self.check_ns_action.setText("🔄 체크 중...")
         
         # Create and start worker thread
+        from lib.workers.domain_ns_worker import DomainNSWorker
+        
         self.ns_check_worker = DomainNSWorker()
         self.ns_check_worker.set_credentials(
             self.client.api_key, 
@@ -1552,11 +2004,8 @@ class DNSManagerGUI(QMainWindow):
         self.ns_check_worker.check_completed.connect(self.on_ns_check_completed)
         self.ns_check_worker.error_occurred.connect(self.on_ns_check_error)
         
-        # Start check in thread
-        from threading import Thread
-        check_thread = Thread(target=self.ns_check_worker.start_check, args=(domains,))
-        check_thread.daemon = True
-        check_thread.start()
+        # Start check on the worker's own thread
+        self.ns_check_worker.start_check(domains)
     
     def on_ns_check_progress(self, current: int, total: int, message: str):
         """Handle nameserver check progress updates"""
@@ -1588,6 +2037,7 @@ class DNSManagerGUI(QMainWindow):
                 "nameservers": domain_info["nameservers"],
                 "is_porkbun": False
             }
+            self._combo_dirty.add(domain)
         
         # Show summary
         if external_ns_domains:
@@ -1626,21 +2076,34 @@ class DNSManagerGUI(QMainWindow):
         QMessageBox.critical(self, "오류", f"네임서버 체크 실패:\n{error_msg}")
     
     def update_domain_combo_colors(self):
-        """Update domain combo box colors based on nameserver status"""
-        for i in range(1, self.domain_combo.count()):
-            domain_name = self.domain_combo.itemData(i)
-            if domain_name and domain_name in self.domain_info:
-                if not self.domain_info[domain_name].get("is_porkbun", True):
-                    # 외부 네임서버 사용 시 빨간색
-                    self.domain_combo.setItemData(i, QColor(255, 0, 0), Qt.ItemDataRole.ForegroundRole)
+        """Recolor only the combo entries whose nameserver status changed"""
+        if not self._combo_dirty:
+            return
+        external_color = QColor(255, 0, 0)
+        for domain_name in self._combo_dirty:
+            index = self._domain_index.get(domain_name)
+            if index is None:
+                continue
+            if not self.domain_info.get(domain_name, {}).get("is_porkbun", True):
+                # 외부 네임서버 사용 시 빨간색
+                self.domain_combo.setItemData(index, external_color, Qt.ItemDataRole.ForegroundRole)
+            else:
+                self.domain_combo.setItemData(index, None, Qt.ItemDataRole.ForegroundRole)
+        self._combo_dirty.clear()
     
     def manage_nameservers(self):
         """Open nameserver management dialog"""
         if not self.current_domain:
             return
         
-        dialog = NameserverDialog(self.client, self.current_domain, self)
+        dialog = NameserverDialog(
+            self.client, self.current_domain, self,
+            cached_nameservers=self.ns_cache.get(self.current_domain)
+        )
         if dialog.exec() == QDialog.DialogCode.Accepted:
+            # 로그인 때 프리페치한 목록은 이제 낡았다. 버리지 않으면
+            # 다음에 열 때 변경 전 네임서버를 다시 보여준다.
+            self.ns_cache.pop(self.current_domain, None)
             # Reload domain list to update nameserver status
             self.load_domains()
 
@@ -1684,6 +2147,21 @@ class DNSManagerGUI(QMainWindow):
         if self.is_logged_in and self.active_profile_id and profile_id != self.active_profile_id:
             self.status_bar.showMessage("다른 프로필이 선택되었습니다. 전환하려면 로그아웃 후 다시 로그인하세요.", 5000)
 
+    def on_nameservers_prefetched(self, ns_map: dict):
+        """Cache nameservers prefetched by the login worker"""
+        self.ns_cache.update(ns_map)
+
+    def _auto_login(self):
+        """Log in automatically at startup when a usable profile exists"""
+        if self.is_logged_in or (self.login_worker and self.login_worker.isRunning()):
+            return
+        profile_id = self.selected_profile_id or self.profile_manager.get_active_profile_id()
+        profile = self.profile_manager.get_profile(profile_id) if profile_id else None
+        if not profile or not profile.get("api_key") or not profile.get("secret_api_key"):
+            # 자동 로그인은 조용히 포기하고 수동 로그인 버튼에 맡긴다
+            return
+        self.start_async_login(profile["api_key"], profile["secret_api_key"], profile_id)
+
     def perform_login(self):
         """Perform login with API credentials"""
         if self.is_logged_in:
@@ -1740,10 +2218,28 @@ class DNSManagerGUI(QMainWindow):
         self.login_progress.show()  # 프로그레스 바 표시
         self.status_bar.showMessage("로그인 진행 중...")
         
-        # 로그인 쓰레드 생성 및 실행
+        # 로그인 쓰레드 생성 및 실행. NS 프리페치 때문에 이전 쓰레드가
+        # success 시그널 이후에도 한참 돌 수 있으므로(도메인 전체 팬아웃,
+        # 15초 타임아웃), 끝날 때까지 참조를 유지한 채 교체한다 —
+        # 로그아웃의 wait(2000)이 시간 초과한 재로그인 경로가 여기다.
+        old_worker = self.login_worker
+        if old_worker is not None and old_worker.isRunning():
+            old_worker.requestInterruption()
+            # 늦게 도착하는 시그널이 새 로그인 상태를 덮어쓰지 않게 차단
+            for signal in (old_worker.success, old_worker.error,
+                           old_worker.nameservers_ready, old_worker.status):
+                try:
+                    signal.disconnect()
+                except TypeError:
+                    pass
+            self._retired_login_workers.append(old_worker)
+            old_worker.finished.connect(
+                lambda w=old_worker: self._retired_login_workers.remove(w)
+            )
         self.login_worker = LoginWorker(api_key, secret_key)
         self.login_worker.success.connect(self.on_login_success)
         self.login_worker.error.connect(self.on_login_error)
+        self.login_worker.nameservers_ready.connect(self.on_nameservers_prefetched)
         self.login_worker.status.connect(self.on_login_status)
         self.login_worker.start()
     
@@ -1827,9 +2323,11 @@ class DNSManagerGUI(QMainWindow):
     def load_cached_ns_info(self):
         """Load cached nameserver information"""
         try:
-            # Create worker to load cached info
-            worker = DomainNSWorker()
-            cached_domains = worker.get_cached_external_domains()
+            # 일회용 워커를 만들 필요 없이 mtime 캐시를 공유하는
+            # staticmethod로 바로 읽는다
+            from lib.workers.domain_ns_worker import DomainNSWorker
+            
+            cached_domains = DomainNSWorker.get_cached_external_domains()
             
             if cached_domains:
                 # Update domain info with cached data
@@ -1839,6 +2337,7 @@ class DNSManagerGUI(QMainWindow):
                         "nameservers": domain_info["nameservers"],
                         "is_porkbun": False
                     }
+                    self._combo_dirty.add(domain)
                 
                 # Update UI
                 if self.dashboard_widget:
@@ -1855,12 +2354,19 @@ class DNSManagerGUI(QMainWindow):
             # Silently ignore if no cached data
             pass
     
+    def closeEvent(self, event):
+        """Release pooled API connections on shutdown"""
+        if self.client:
+            self.client.close()
+        super().closeEvent(event)
+    
     def logout(self):
         """Logout and clear session"""
-        # 로그인 쓰레드가 실행 중이면 중지
+        # 로그인 쓰레드가 실행 중이면 협조적으로 중단 요청
+        # (terminate()는 소켓/락을 잡은 채 죽일 수 있어 위험)
         if self.login_worker and self.login_worker.isRunning():
-            self.login_worker.terminate()
-            self.login_worker.wait()
+            self.login_worker.requestInterruption()
+            self.login_worker.wait(2000)
 
         if self.bulk_worker and self.bulk_worker.isRunning():
             QMessageBox.warning(self, "경고", "대량 작업이 끝난 뒤에 로그아웃할 수 있습니다.")
@@ -1871,6 +2377,11 @@ class DNSManagerGUI(QMainWindow):
         self.client = None
         self.is_logged_in = False
         self.current_domain = None
+        # 다른 계정으로 재로그인 시 이전 계정의 NS 캐시가 남지 않도록
+        from lib.workers.domain_ns_worker import DomainNSWorker
+        DomainNSWorker.reset_cache()
+        self.ns_cache.clear()
+        self._record_cache.clear()
         self.current_records = []
         self.modified_records = {}
         self.domain_info = {}
@@ -1890,11 +2401,12 @@ class DNSManagerGUI(QMainWindow):
         # 컨트롤 비활성화
         self.domain_combo.setEnabled(False)
         self.domain_combo.clear()
+        self._domain_index = {}
         self.refresh_domains_btn.setEnabled(False)
         self.copy_domain_btn.setEnabled(False)
         self.nameserver_btn.setEnabled(False)
         self.set_buttons_enabled(False)
-        self.records_table.setRowCount(0)
+        self.records_model.clear()
         self.active_domains = []
         if hasattr(self, "bulk_domain_list"):
             self.bulk_domain_list.clear()
@@ -1922,37 +2434,41 @@ class DNSManagerGUI(QMainWindow):
         current_selection = self.current_domain
         selection_restored = False
         
-        # Temporarily disconnect the signal to prevent auto-loading
-        if self.domain_combo.receivers(self.domain_combo.currentTextChanged) > 0:
-            self.domain_combo.currentTextChanged.disconnect()
-        self.domain_combo.clear()
-        
-        # Add empty item first for no selection
-        self.domain_combo.addItem("-- 도메인을 선택하세요 --")
-        
-        domain_count = 0
-        self.domain_info = {}
-        active_domains = []
-        
-        for domain in domains:
-            if domain.get("status") == "ACTIVE":
-                domain_name = domain.get("domain")
-                domain_count += 1
-                active_domains.append(domain_name)
-                
-                # 간단한 도메인 정보만 저장 (네임서버 체크는 나중에)
-                self.domain_combo.addItem(domain_name, domain_name)
-                self.domain_info[domain_name] = {
-                    "nameservers": [],
-                    "is_porkbun": True
-                }
-        
-        # Restore previous selection if it exists
-        if current_selection:
-            index = self.domain_combo.findText(current_selection)
-            if index >= 0:
-                self.domain_combo.setCurrentIndex(index)
-                selection_restored = True
+        # 재구성 중의 currentTextChanged는 QSignalBlocker로 막는다 —
+        # 예외가 나도 스코프를 벗어나면 자동 해제되므로 기존의
+        # disconnect/reconnect 방식처럼 연결이 끊긴 채 남지 않는다
+        with QSignalBlocker(self.domain_combo):
+            self.domain_combo.clear()
+            
+            # Add empty item first for no selection
+            self.domain_combo.addItem("-- 도메인을 선택하세요 --")
+            
+            domain_count = 0
+            self.domain_info = {}
+            self._domain_index = {}
+            self._combo_dirty.clear()  # 콤보를 새로 채우면 이전 더티 목록은 무효
+            active_domains = []
+            
+            for domain in domains:
+                if domain.get("status") == "ACTIVE":
+                    domain_name = domain.get("domain")
+                    domain_count += 1
+                    active_domains.append(domain_name)
+                    
+                    # 간단한 도메인 정보만 저장 (네임서버 체크는 나중에)
+                    self.domain_combo.addItem(domain_name, domain_name)
+                    self._domain_index[domain_name] = self.domain_combo.count() - 1
+                    self.domain_info[domain_name] = {
+                        "nameservers": [],
+                        "is_porkbun": True
+                    }
+            
+            # Restore previous selection if it exists
+            if current_selection:
+                index = self.domain_combo.findText(current_selection)
+                if index >= 0:
+                    self.domain_combo.setCurrentIndex(index)
+                    selection_restored = True
         
         self.active_domains = active_domains
         self.populate_bulk_domain_list(active_domains)
@@ -1976,9 +2492,6 @@ class DNSManagerGUI(QMainWindow):
         else:
             self.status_bar.showMessage("활성 도메인이 없음", 2000)
         
-        # Reconnect the signal
-        self.domain_combo.currentTextChanged.connect(self.on_domain_changed)
-
         # When 도메인 목록을 새로 불러오면 현재 선택된 도메인의 레코드도 강제 갱신해준다
         if selection_restored:
             self.on_domain_changed(self.domain_combo.currentText())
@@ -1987,7 +2500,7 @@ class DNSManagerGUI(QMainWindow):
             self.current_domain = None
             self.set_buttons_enabled(False)
             self.nameserver_btn.setEnabled(False)
-            self.records_table.setRowCount(0)
+            self.records_model.clear()
     
     
     def load_domains(self):
@@ -1996,24 +2509,44 @@ class DNSManagerGUI(QMainWindow):
             QMessageBox.warning(self, "경고", "먼저 로그인해주세요")
             return
         
+        if getattr(self, "_domains_worker", None) and self._domains_worker.isRunning():
+            return  # 이미 새로고침 중
+        
         self.status_bar.showMessage("도메인 불러오는 중...")
         
-        try:
-            domains = self.client.get_domains()
-            self.process_domains(domains)
-        except Exception as e:
-            QMessageBox.critical(self, "오류", f"도메인 로드 실패: {str(e)}")
-            self.status_bar.showMessage("도메인 로드 실패", 2000)
+        # HTTPS 왕복 동안 GUI가 멈추지 않도록 LoginWorker와 같은
+        # QThread 패턴으로 백그라운드에서 가져온다
+        self._domains_worker = DomainsFetchWorker(self.client)
+        self._domains_worker.success.connect(self.process_domains)
+        self._domains_worker.error.connect(self.on_domains_fetch_error)
+        self._domains_worker.start()
+    
+    def on_domains_fetch_error(self, error_msg: str):
+        """Handle domain list fetch failure"""
+        QMessageBox.critical(self, "오류", f"도메인 로드 실패: {error_msg}")
+        self.status_bar.showMessage("도메인 로드 실패", 2000)
     
     def on_domain_changed(self, domain_text: str):
+        """Debounce domain selection; only the last choice loads records"""
+        self._pending_domain_text = domain_text
+        self._domain_change_timer.start()
+    
+    def _commit_domain_change(self):
         """Handle domain selection change"""
+        # setData는 캐시에 들어 있는 dict를 제자리에서 고치므로, 저장
+        # 안 된 편집을 남겨 두고 떠나면 그 캐시 항목은 더 이상 서버
+        # 상태가 아니다. 버려서 다음 방문 때 다시 받아오게 한다 —
+        # 그렇지 않으면 편집값이 저장된 것처럼 보이면서 전송은 안 된다.
+        if self.modified_records and self.current_domain:
+            self._record_cache.pop(self.current_domain, None)
+        domain_text = self._pending_domain_text
         # Get actual domain name from user data
         current_index = self.domain_combo.currentIndex()
         if current_index > 0:  # Skip placeholder
             domain = self.domain_combo.itemData(current_index)
             if not domain:  # Fallback to text if no data
                 # Remove indicators from text
-                domain = domain_text.replace("🐷 ", "").replace("⚠️ ", "").replace(" (외부 NS)", "")
+                domain = _INDICATOR_RE.sub("", domain_text)
             
             if domain:
                 self.current_domain = domain
@@ -2040,19 +2573,30 @@ class DNSManagerGUI(QMainWindow):
         self.set_buttons_enabled(False)
         self.nameserver_btn.setEnabled(False)
         self.copy_domain_btn.setEnabled(False)
-        self.records_table.setRowCount(0)
+        self.records_model.clear()
         if domain_text == "-- 도메인을 선택하세요 --":
             self.status_bar.showMessage("도메인을 선택해주세요", 2000)
     
-    def load_records(self):
-        """Load DNS records for current domain"""
+    RECORD_CACHE_TTL = 30.0  # seconds
+
+    def load_records(self, force: bool = False):
+        """Load DNS records for current domain (cached for a short TTL)"""
         if not self.client or not self.current_domain:
             return
         
+        if not force:
+            cached = self._record_cache.get(self.current_domain)
+            if cached and time.monotonic() - cached[0] < self.RECORD_CACHE_TTL:
+                self.current_records = cached[1]
+                self.populate_table()
+                self.status_bar.showMessage(f"{len(self.current_records)}개 레코드 (캐시)", 2000)
+                return
+        
         self.status_bar.showMessage(f"{self.current_domain}의 레코드 불러오는 중...")
         
         try:
             self.current_records = self.client.get_dns_records(self.current_domain)
+            self._record_cache[self.current_domain] = (time.monotonic(), self.current_records)
             self.populate_table()
             self.status_bar.showMessage(f"{len(self.current_records)}개 레코드 로드됨", 2000)
         except Exception as e:
@@ -2072,69 +2616,8 @@ class DNSManagerGUI(QMainWindow):
     
     def populate_table(self):
         """Populate the records table"""
-        # Temporarily disconnect item changed signal
-        self.records_table.itemChanged.disconnect()
-        
-        self.records_table.setRowCount(len(self.current_records))
         self.modified_records.clear()  # Clear modifications when reloading
-        
-        for row, record in enumerate(self.current_records):
-            # ID (hidden)
-            id_item = QTableWidgetItem(record.get("id", ""))
-            id_item.setFlags(id_item.flags() & ~Qt.ItemFlag.ItemIsEditable)  # Non-editable
-            self.records_table.setItem(row, 0, id_item)
-            
-            # Name
-            name = record.get("name", "@")
-            if name == self.current_domain:
-                name = "@"
-            name_item = QTableWidgetItem(name)
-            self.records_table.setItem(row, 1, name_item)
-            
-            # Type (non-editable)
-            type_item = QTableWidgetItem(record.get("type", ""))
-            type_item.setFlags(type_item.flags() & ~Qt.ItemFlag.ItemIsEditable)  # Non-editable
-            bold_font = QFont()
-            bold_font.setPointSize(9)
-            bold_font.setBold(True)
-            type_item.setFont(bold_font)
-            
-            # Color code by type
-            record_type = record.get("type", "")
-            if record_type == "A":
-                type_item.setForeground(QColor(0, 128, 0))
-            elif record_type == "AAAA":
-                type_item.setForeground(QColor(0, 100, 0))
-            elif record_type == "CNAME":
-                type_item.setForeground(QColor(0, 0, 200))
-            elif record_type == "MX":
-                type_item.setForeground(QColor(200, 0, 0))
-            elif record_type == "TXT":
-                type_item.setForeground(QColor(128, 0, 128))
-            
-            self.records_table.setItem(row, 2, type_item)
-            
-            # Content (editable)
-            content_item = QTableWidgetItem(record.get("content", ""))
-            self.records_table.setItem(row, 3, content_item)
-            
-            # TTL (editable)
-            ttl_item = QTableWidgetItem(str(record.get("ttl", "")))
-            self.records_table.setItem(row, 4, ttl_item)
-            
-            # Priority (editable for MX records)
-            prio = record.get("prio", "")
-            prio_item = QTableWidgetItem(str(prio) if prio else "")
-            if record_type not in ["MX", "SRV"]:
-                prio_item.setFlags(prio_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-            self.records_table.setItem(row, 5, prio_item)
-            
-            # Notes (editable)
-            notes_item = QTableWidgetItem(record.get("notes", ""))
-            self.records_table.setItem(row, 6, notes_item)
-        
-        # Reconnect the signal
-        self.records_table.itemChanged.connect(self.on_item_changed)
+        self.records_model.set_records(self.current_records, self.current_domain or "")
         
         # Reset save button
         self.save_btn.setEnabled(False)
@@ -2151,29 +2634,87 @@ class DNSManagerGUI(QMainWindow):
             
             self.status_bar.showMessage("Adding record...")
             
-            try:
-                result = self.client.create_dns_record(
-                    domain=self.current_domain,
-                    record_type=data["type"],
-                    content=data["content"],
-                    name=data["name"],
-                    ttl=data["ttl"],
-                    prio=data.get("prio"),
-                    notes=data["notes"] if data["notes"] else None
-                )
-                
-                if result.get("status") == "SUCCESS":
-                    QMessageBox.information(self, "Success", "Record added successfully!")
-                    self.load_records()
-                else:
-                    QMessageBox.warning(self, "Failed", f"Failed to add record: {result.get('message')}")
-            except Exception as e:
-                QMessageBox.critical(self, "Error", f"Error adding record: {str(e)}")
-                self.status_bar.showMessage("Failed to add record", 2000)
+            self._pending_record_data = data
+            self._start_mutations(
+                [(
+                    "add",
+                    "create_dns_record",
+                    dict(
+                        domain=self.current_domain,
+                        record_type=data["type"],
+                        content=data["content"],
+                        name=data["name"],
+                        ttl=data["ttl"],
+                        prio=data.get("prio"),
+                        notes=data["notes"] if data["notes"] else None,
+                    ),
+                )],
+                self._on_add_record_done,
+            )
+    
+    def _start_mutations(self, mutations: list, on_finished):
+        """Run record mutations on the global pool, keeping the worker alive.
+
+        동일한 시그니처의 작업이 이미 진행 중이면 (저장 버튼 연타 등)
+        다시 제출하지 않는 single-flight 처리를 한다.
+        """
+        fresh = []
+        keys = []
+        for label, method_name, kwargs in mutations:
+            key = (method_name, tuple(sorted((k, str(v)) for k, v in kwargs.items())))
+            if key in self._inflight_mutations:
+                continue
+            self._inflight_mutations.add(key)
+            keys.append(key)
+            fresh.append((label, method_name, kwargs))
+        
+        if not fresh:
+            self.status_bar.showMessage("이미 처리 중입니다", 2000)
+            return
+        
+        worker = RecordMutationWorker(self.client, fresh)
+        
+        def _finished(results, _keys=tuple(keys)):
+            for key in _keys:
+                self._inflight_mutations.discard(key)
+            on_finished(results)
+        
+        worker.signals.finished.connect(_finished)
+        self._mutation_worker = worker  # GC 방지용 참조
+        QThreadPool.globalInstance().start(worker)
+    
+    def _on_add_record_done(self, results: list):
+        """Handle completion of a background record creation"""
+        _, result, error = results[0]
+        if error is not None:
+            QMessageBox.critical(self, "Error", f"Error adding record: {error}")
+            self.status_bar.showMessage("Failed to add record", 2000)
+        elif result.get("status") == "SUCCESS":
+            # 전체 존을 다시 받지 않고 새 레코드만 모델에 끼워 넣는다
+            data = self._pending_record_data
+            new_id = result.get("id")
+            if new_id is None or data is None:
+                self.load_records(force=True)  # 응답에 id가 없으면 서버 기준으로 재동기화
+            else:
+                name = data["name"].strip()
+                record = {
+                    "id": str(new_id),
+                    "name": f"{name}.{self.current_domain}" if name and name != "@" else self.current_domain,
+                    "type": data["type"],
+                    "content": data["content"],
+                    "ttl": str(data["ttl"]),
+                    "prio": str(data["prio"]) if data.get("prio") is not None else "0",
+                    "notes": data["notes"] or "",
+                }
+                self.records_model.append_record(record)
+            self.status_bar.showMessage("레코드 추가됨", 3000)
+            self._pending_record_data = None
+        else:
+            QMessageBox.warning(self, "Failed", f"Failed to add record: {result.get('message')}")
     
     def edit_record(self):
         """Edit selected DNS record"""
-        current_row = self.records_table.currentRow()
+        current_row = self.records_table.currentIndex().row()
         if current_row < 0 or current_row >= len(self.current_records):
             QMessageBox.warning(self, "Warning", "Please select a record to edit")
             return
@@ -2186,32 +2727,63 @@ class DNSManagerGUI(QMainWindow):
             
             self.status_bar.showMessage("Updating record...")
             
-            try:
-                result = self.client.edit_dns_record(
-                    domain=self.current_domain,
-                    record_id=record.get("id"),
-                    record_type=data["type"],
-                    content=data["content"],
-                    name=data["name"],
-                    ttl=data["ttl"],
-                    prio=data.get("prio"),
-                    notes=data["notes"] if data["notes"] else None
-                )
-                
-                if result.get("status") == "SUCCESS":
-                    QMessageBox.information(self, "Success", "Record updated successfully!")
-                    self.load_records()
-                else:
-                    QMessageBox.warning(self, "Failed", f"Failed to update record: {result.get('message')}")
-            except Exception as e:
-                QMessageBox.critical(self, "Error", f"Error updating record: {str(e)}")
-                self.status_bar.showMessage("Failed to update record", 2000)
+            self._pending_record_data = data
+            self._pending_edit_row = current_row
+            self._start_mutations(
+                [(
+                    "edit",
+                    "edit_dns_record",
+                    dict(
+                        domain=self.current_domain,
+                        record_id=record.get("id"),
+                        record_type=data["type"],
+                        content=data["content"],
+                        name=data["name"],
+                        ttl=data["ttl"],
+                        prio=data.get("prio"),
+                        notes=data["notes"] if data["notes"] else None,
+                    ),
+                )],
+                self._on_edit_record_done,
+            )
+    
+    def _on_edit_record_done(self, results: list):
+        """Handle completion of a background record update"""
+        _, result, error = results[0]
+        if error is not None:
+            QMessageBox.critical(self, "Error", f"Error updating record: {error}")
+            self.status_bar.showMessage("Failed to update record", 2000)
+        elif result.get("status") == "SUCCESS":
+            # 수정된 행만 제자리에서 갱신하고 전체 재조회는 생략한다
+            data = self._pending_record_data
+            row = self._pending_edit_row
+            if data is None or not 0 <= row < len(self.current_records):
+                self.load_records(force=True)
+            else:
+                name = data["name"].strip()
+                record = self.current_records[row]
+                record.update({
+                    "name": f"{name}.{self.current_domain}" if name and name != "@" else self.current_domain,
+                    "type": data["type"],
+                    "content": data["content"],
+                    "ttl": str(data["ttl"]),
+                    "notes": data["notes"] or "",
+                })
+                if data.get("prio") is not None:
+                    record["prio"] = str(data["prio"])
+                self.records_model.refresh_row(row)
+            self.status_bar.showMessage("레코드 수정됨", 3000)
+            self._pending_record_data = None
+            self._pending_edit_row = -1
+        else:
+            QMessageBox.warning(self, "Failed", f"Failed to update record: {result.get('message')}")
     
     def delete_record(self):
         """Delete selected DNS record(s)"""
-        selected_rows = set()
-        for item in self.records_table.selectedItems():
-            selected_rows.add(item.row())
+        selected_rows = [
+            index.row()
+            for index in self.records_table.selectionModel().selectedRows()
+        ]
         
         if not selected_rows:
             QMessageBox.warning(self, "Warning", "Please select record(s) to delete")
@@ -2226,23 +2798,49 @@ class DNSManagerGUI(QMainWindow):
         if reply == QMessageBox.StandardButton.Yes:
             self.status_bar.showMessage("Deleting records...")
             
-            errors = []
-            for row in selected_rows:
-                if row < len(self.current_records):
-                    record = self.current_records[row]
-                    try:
-                        result = self.client.delete_dns_record(self.current_domain, record.get("id"))
-                        if result.get("status") != "SUCCESS":
-                            errors.append(f"Failed to delete {record.get('name')}: {result.get('message')}")
-                    except Exception as e:
-                        errors.append(f"Error deleting {record.get('name')}: {str(e)}")
-            
-            if errors:
-                QMessageBox.warning(self, "Errors", "\n".join(errors))
+            # 선택된 레코드를 한 워커에서 병렬로 지운다 — k개 삭제가
+            # k·RTT 대신 대략 한 번의 왕복으로 끝난다
+            mutations = [
+                (
+                    (
+                        self.current_records[row].get("name", ""),
+                        self.current_records[row].get("id"),
+                    ),
+                    "delete_dns_record",
+                    dict(
+                        domain=self.current_domain,
+                        record_id=self.current_records[row].get("id"),
+                    ),
+                )
+                for row in selected_rows
+                if row < len(self.current_records)
+            ]
+            self._start_mutations(mutations, self._on_delete_records_done)
+    
+    def _on_delete_records_done(self, results: list):
+        """Report the outcome of a background bulk delete"""
+        errors_buf = io.StringIO()
+        deleted_ids = []
+        for (name, record_id), result, error in results:
+            if error is not None:
+                errors_buf.write(f"Error deleting {name}: {error}\n")
+            elif result.get("status") != "SUCCESS":
+                errors_buf.write(f"Failed to delete {name}: {result.get('message')}\n")
             else:
-                QMessageBox.information(self, "Success", f"Deleted {record_count} record(s)")
-            
-            self.load_records()
+                deleted_ids.append(record_id)
+        errors = errors_buf.getvalue()
+        
+        for record_id in deleted_ids:
+            self.modified_records.pop(str(record_id), None)
+        
+        if errors:
+            QMessageBox.warning(self, "Errors", errors.rstrip("\n"))
+            # 일부만 지워졌을 수 있으므로 서버 상태 기준으로 재동기화
+            self.load_records(force=True)
+        else:
+            # 성공한 행만 모델에서 제거 — 전체 존 재조회 생략
+            self.records_model.remove_records_by_id(deleted_ids)
+            self.status_bar.showMessage(f"Deleted {len(deleted_ids)} record(s)", 3000)
     
     def export_records(self):
         """Export DNS records"""
@@ -2250,87 +2848,69 @@ class DNSManagerGUI(QMainWindow):
             QMessageBox.warning(self, "Warning", "No records to export")
             return
         
-        file_path, _ = QFileDialog.getSaveFileName(
-            self, "Export Records", f"{self.current_domain}_dns_records.json",
-            "JSON Files (*.json);;CSV Files (*.csv);;Zone Files (*.zone);;All Files (*.*)"
-        )
+        # 정적 getSaveFileName은 호출마다 다이얼로그를 새로 만든다 —
+        # 인스턴스를 재사용하면 다음 호출이 빨라지고 마지막 디렉터리도 유지됨
+        if self._export_dialog is None:
+            self._export_dialog = QFileDialog(self)
+            self._export_dialog.setAcceptMode(QFileDialog.AcceptMode.AcceptSave)
+            self._export_dialog.setWindowTitle("Export Records")
+            self._export_dialog.setNameFilters([
+                "JSON Files (*.json)",
+                "CSV Files (*.csv)",
+                "Zone Files (*.zone)",
+                "All Files (*.*)",
+            ])
+        self._export_dialog.selectFile(f"{self.current_domain}_dns_records.json")
+        
+        file_path = None
+        if self._export_dialog.exec():
+            selected = self._export_dialog.selectedFiles()
+            file_path = selected[0] if selected else None
         
         if file_path:
-            try:
-                if file_path.endswith(".csv"):
-                    content = self.client.export_dns_records(self.current_domain, "csv")
-                elif file_path.endswith(".zone"):
-                    content = self.client.export_dns_records(self.current_domain, "zone")
-                else:
-                    content = self.client.export_dns_records(self.current_domain, "json")
-                
-                with open(file_path, "w") as f:
-                    f.write(content)
-                
-                QMessageBox.information(self, "성공", f"레코드가 {file_path}로 내보내짐")
-                self.status_bar.showMessage(f"{file_path}로 내보내짐", 3000)
-            except Exception as e:
-                QMessageBox.critical(self, "오류", f"내보내기 실패: {str(e)}")
+            ext = os.path.splitext(file_path)[1].lower()
+            export_format = _EXT_TO_FMT.get(ext, "json")
+            
+            # 존 조회 + 직렬화 + 디스크 쓰기를 스레드 풀로 넘겨
+            # 내보내는 동안에도 이벤트 루프가 계속 돈다
+            self.status_bar.showMessage("레코드 내보내는 중...")
+            task = ExportTask(self.client, self.current_domain, export_format, file_path)
+            task.signals.finished.connect(self._on_export_finished)
+            task.signals.error.connect(self._on_export_error)
+            self._export_task = task  # GC 방지용 참조
+            QThreadPool.globalInstance().start(task)
+    
+    def _on_export_finished(self, file_path: str):
+        """Report a completed background export"""
+        QMessageBox.information(self, "성공", f"레코드가 {file_path}로 내보내짐")
+        self.status_bar.showMessage(f"{file_path}로 내보내짐", 3000)
     
-    def on_item_changed(self, item):
-        """Handle item changes in the table"""
-        if not item:
+    def _on_export_error(self, error_msg: str):
+        """Report a failed background export"""
+        QMessageBox.critical(self, "오류", f"내보내기 실패: {error_msg}")
+        self.status_bar.showMessage("내보내기 실패", 2000)
+    
+    def on_record_edited(self, record_id: str, field: str, value):
+        """Track an in-table edit coming from the records model"""
+        if not record_id:
             return
         
-        row = item.row()
-        col = item.column()
+        self.modified_records.setdefault(record_id, {})[field] = value
         
-        # Don't track changes to ID or Type columns
-        if col in [0, 2]:
+        # 버튼 재스타일과 상태바 갱신은 50ms 안의 연속 편집을 모아
+        # 한 번만 수행한다 — 키 입력마다 스타일 재계산을 피함
+        if not self._ui_flush_timer.isActive():
+            self._ui_flush_timer.start(50)
+    
+    def _flush_modification_ui(self):
+        """Apply save-button state and status text once per dirty batch"""
+        if not self.modified_records:
             return
-        
-        # Get the record ID
-        record_id = self.records_table.item(row, 0).text()
-        
-        if record_id not in self.modified_records:
-            self.modified_records[record_id] = {}
-        
-        # Map column to field name
-        field_map = {
-            1: "name",
-            3: "content",
-            4: "ttl",
-            5: "prio",
-            6: "notes"
-        }
-        
-        field = field_map.get(col)
-        if field:
-            # Store the new value
-            value = item.text()
-            
-            # Convert TTL to int if it's a number
-            if field == "ttl":
-                try:
-                    value = int(value) if value else 600
-                except ValueError:
-                    value = 600
-                    item.setText(str(value))
-            
-            # Convert priority to int if it's a number
-            if field == "prio" and value:
-                try:
-                    value = int(value)
-                except ValueError:
-                    value = ""
-                    item.setText("")
-            
-            self.modified_records[record_id][field] = value
-            
-            # Highlight the modified cell
-            item.setBackground(QColor(255, 255, 200))  # Light yellow
-            
-            # Enable save button
+        if not self.save_btn.isEnabled():
+            # 스타일시트는 더티 배치당 한 번만 적용
             self.save_btn.setEnabled(True)
-            self.save_btn.setStyleSheet("QPushButton { background-color: #4CAF50; color: white; font-weight: bold; }")
-            
-            # Update status
-            self.status_bar.showMessage(f"수정됨: {len(self.modified_records)}개 레코드 변경됨", 2000)
+            self.save_btn.setStyleSheet(_SAVE_DIRTY_QSS)
+        self.status_bar.showMessage(f"수정됨: {len(self.modified_records)}개 레코드 변경됨", 2000)
     
     def refresh_current_domain(self):
         """Refresh records for the current domain"""
@@ -2345,7 +2925,8 @@ class DNSManagerGUI(QMainWindow):
                 return
         
         if self.current_domain:
-            self.load_records()
+            # 사용자가 직접 누른 새로고침은 항상 네트워크를 탄다
+            self.load_records(force=True)
         else:
             self.status_bar.showMessage("선택된 도메인이 없습니다", 2000)
     
@@ -2358,25 +2939,19 @@ class DNSManagerGUI(QMainWindow):
         if not self.client or not self.current_domain:
             return
         
-        errors = []
-        success_count = 0
-        
-        self.status_bar.showMessage("변경사항 저장 중...")
+        # id → 레코드 인덱스를 한 번만 만들어 O(N·M) 중첩 스캔을 없앤다
+        record_index = {record.get("id"): record for record in self.current_records}
         
+        mutations = []
         for record_id, changes in self.modified_records.items():
-            # Find the original record
-            original_record = None
-            for record in self.current_records:
-                if record.get("id") == record_id:
-                    original_record = record
-                    break
-            
+            original_record = record_index.get(record_id)
             if not original_record:
                 continue
             
-            # Prepare the update data
-            try:
-                result = self.client.edit_dns_record(
+            mutations.append((
+                record_id,
+                "edit_dns_record",
+                dict(
                     domain=self.current_domain,
                     record_id=record_id,
                     record_type=original_record.get("type"),
@@ -2384,25 +2959,48 @@ class DNSManagerGUI(QMainWindow):
                     name=changes.get("name", original_record.get("name", "")),
                     ttl=changes.get("ttl", original_record.get("ttl", 600)),
                     prio=changes.get("prio", original_record.get("prio")) if original_record.get("type") in ["MX", "SRV"] else None,
-                    notes=changes.get("notes", original_record.get("notes", ""))
-                )
-                
-                if result.get("status") == "SUCCESS":
-                    success_count += 1
-                else:
-                    errors.append(f"레코드 {record_id} 업데이트 실패: {result.get('message')}")
-            except Exception as e:
-                errors.append(f"레코드 {record_id} 업데이트 오류: {str(e)}")
+                    notes=changes.get("notes", original_record.get("notes", "")),
+                ),
+            ))
+        
+        if not mutations:
+            self.status_bar.showMessage("변경사항이 없습니다", 2000)
+            return
+        
+        self.status_bar.showMessage("변경사항 저장 중...")
+        self.save_btn.setEnabled(False)
+        self._start_mutations(mutations, self._on_save_changes_done)
+    
+    def _on_save_changes_done(self, results: list):
+        """Report the outcome of a background bulk save"""
+        # 대량 실패 시 메시지 리스트를 따로 들고 있지 않도록 버퍼에 바로 쓴다
+        errors_buf = io.StringIO()
+        saved_ids = []
+        for record_id, result, error in results:
+            if error is not None:
+                errors_buf.write(f"레코드 {record_id} 업데이트 오류: {error}\n")
+            elif result.get("status") == "SUCCESS":
+                saved_ids.append(record_id)
+            else:
+                errors_buf.write(f"레코드 {record_id} 업데이트 실패: {result.get('message')}\n")
+        errors = errors_buf.getvalue()
+        
+        # 성공한 레코드만 수정 목록에서 제거 — 부분 실패 시 실패한
+        # 행의 하이라이트와 변경 내용은 그대로 남아 재시도할 수 있다
+        for record_id in saved_ids:
+            self.modified_records.pop(record_id, None)
+        self.records_model.clear_modified_marks_for(saved_ids)
         
         if errors:
-            QMessageBox.warning(self, "일부 오류 발생", "\n".join(errors))
+            QMessageBox.warning(self, "일부 오류 발생", errors.rstrip("\n"))
         
-        if success_count > 0:
-            QMessageBox.information(self, "저장 완료", f"{success_count}개 레코드가 성공적으로 업데이트되었습니다.")
-            # Reload to get fresh data
-            self.load_records()
+        if self.modified_records:
+            self.save_btn.setEnabled(True)
+        else:
+            self.save_btn.setEnabled(False)
+            self.save_btn.setStyleSheet("")
         
-        self.status_bar.showMessage(f"{success_count}개 레코드 저장됨", 2000)
+        self.status_bar.showMessage(f"{len(saved_ids)}개 레코드 저장됨", 2000)
 
     def on_bulk_record_type_changed(self, record_type: str):
         """Toggle priority field visibility for bulk form."""
@@ -2625,9 +3223,22 @@ class DNSManagerGUI(QMainWindow):
 
 def main():
     """Main entry point for GUI"""
+    from dotenv import load_dotenv
+    
+    load_dotenv()
+    
     app = QApplication(sys.argv)
     app.setStyle("Fusion")  # Modern look
     
+    # 정적 QSS는 앱 수준에서 한 번만 파싱한다
+    from lib.theme import apply_app_styles
+    apply_app_styles(app)
+    
+    # Bound the shared pool used for background loads/probes so many
+    # in-flight API calls reuse threads instead of oversubscribing
+    cpu_count = os.cpu_count() or 4
+    QThreadPool.globalInstance().setMaxThreadCount(min(16, cpu_count * 4))
+    
     # Set default font to avoid font warnings on Windows
     from PyQt6.QtGui import QFont
     if sys.platform == "win32":